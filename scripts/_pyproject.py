@@ -0,0 +1,26 @@
+from __future__ import annotations
+
+from functools import lru_cache
+from pathlib import Path
+from typing import Any
+
+try:
+    import tomllib
+except ModuleNotFoundError:  # pragma: no cover - for Python < 3.11
+    import tomli as tomllib
+
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+PYPROJECT_PATH = REPO_ROOT / "pyproject.toml"
+
+
+@lru_cache(maxsize=4)
+def load(path: Path = PYPROJECT_PATH) -> dict[str, Any]:
+    """Parse pyproject.toml once per path for the lifetime of the process."""
+    with path.open("rb") as fh:
+        return tomllib.load(fh)
+
+
+def get_version(path: Path = PYPROJECT_PATH) -> str | None:
+    version = load(path).get("project", {}).get("version")
+    return str(version) if version else None
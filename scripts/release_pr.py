@@ -4,8 +4,10 @@ from __future__ import annotations
 import argparse
 import datetime as dt
 import logging
+import os
 import re
 import subprocess
+import sys
 import time
 from pathlib import Path
 from typing import Iterable, Literal
@@ -21,8 +23,22 @@ UPDATE_CONTRIBUTORS_SCRIPT = REPO_ROOT / "scripts" / "update_contributors.py"
 
 logger = logging.getLogger(__name__)
 
+_PRERELEASE_RE = re.compile(r"(?:a|b|rc)\d*$", re.IGNORECASE)
+
+# Output of read-only queries (_git_read) only depends on refs/config; cached
+# until a command that may move refs runs (a mutating git call or external command).
+_git_cache: dict[tuple[str, ...], str] = {}
+
+# Subcommands that never move refs or touch the index. Any other subcommand run through
+# run_git (add, commit, push, tag, fetch, checkout, ...) invalidates the cache; add a
+# subcommand here only if it is read-only for every argument form.
+_READ_ONLY_GIT = frozenset({"status", "diff", "log", "show", "rev-parse", "describe", "merge-base", "ls-remote"})
+
 
 def run_git(args: Iterable[str], check: bool = True) -> subprocess.CompletedProcess[str]:
+    args = tuple(args)
+    if not args or args[0] not in _READ_ONLY_GIT:
+        _git_cache.clear()
     result = subprocess.run(
         ["git", *args],
         cwd=REPO_ROOT,
@@ -36,7 +52,34 @@ def run_git(args: Iterable[str], check: bool = True) -> subprocess.CompletedProc
     return result
 
 
+def _git_read(args: Iterable[str], check: bool = True) -> str | None:
+    """Stripped stdout of a read-only git query, cached until a mutating command runs.
+
+    Returns None on failure when ``check`` is False; otherwise exits with git's stderr.
+    """
+    args = tuple(args)
+    cached = _git_cache.get(args)
+    if cached is not None:
+        return cached
+    try:
+        out = subprocess.check_output(
+            ["git", *args],
+            cwd=REPO_ROOT,
+            text=True,
+            stderr=subprocess.PIPE,
+        ).strip()
+    except subprocess.CalledProcessError as exc:
+        if check:
+            msg = (exc.stderr or "").strip() or f"exit {exc.returncode}"
+            raise SystemExit(f"git {' '.join(args)} failed: {msg}")
+        return None
+    _git_cache[args] = out
+    return out
+
+
 def run_cmd(args: list[str], check: bool = True) -> subprocess.CompletedProcess[str]:
+    # External tools (release_prep, gh) may fetch or move refs.
+    _git_cache.clear()
     result = subprocess.run(
         args,
         cwd=REPO_ROOT,
@@ -51,56 +94,55 @@ def run_cmd(args: list[str], check: bool = True) -> subprocess.CompletedProcess[
 
 
 def require_clean_worktree() -> None:
-    status = run_git(["status", "--porcelain"], check=True).stdout.strip()
+    # Only tracked changes matter for release commits; skip the untracked-file walk.
+    status = run_git(["status", "--porcelain=v1", "-z", "--untracked-files=no"], check=True).stdout
     if status:
         raise SystemExit("Working tree is not clean. Commit or stash changes first.")
 
 
 def get_current_branch() -> str:
-    return run_git(["rev-parse", "--abbrev-ref", "HEAD"], check=True).stdout.strip()
+    return _git_read(["rev-parse", "--abbrev-ref", "HEAD"]) or ""
 
 
 def get_remote_url(remote: str) -> str:
-    return run_git(["remote", "get-url", remote], check=True).stdout.strip()
+    return _git_read(["remote", "get-url", remote]) or ""
 
 
 def parse_owner_repo(remote_url: str) -> tuple[str, str]:
-    cleaned = remote_url.rstrip("/")
-    match = re.search(r"[:/](?P<owner>[^/]+)/(?P<repo>[^/]+)$", cleaned)
-    if not match:
+    # Handles both scp-style (git@host:owner/repo.git) and URL forms.
+    rest, _, repo = remote_url.rstrip("/").rpartition("/")
+    repo = repo[: -len(".git")] if repo.endswith(".git") else repo
+    owner = rest.rpartition("/")[2].rpartition(":")[2]
+    if not owner or not repo or owner == rest:
         raise SystemExit(f"Could not parse owner/repo from remote URL: {remote_url}")
-    repo = match.group("repo")
-    if repo.endswith(".git"):
-        repo = repo[: -len(".git")]
-    return match.group("owner"), repo
+    return owner, repo
 
 
 def ensure_remote_branch(remote: str, branch: str, *, dry_run: bool) -> None:
     if dry_run:
         logger.info("[dry-run] Would ensure remote branch exists: %s/%s", remote, branch)
         return
-    head = run_git(["ls-remote", "--heads", remote, branch], check=True).stdout.strip()
+    head = _git_read(["ls-remote", "--heads", remote, branch])
     if not head:
         run_git(["push", "-u", remote, f"HEAD:{branch}"], check=True)
 
 
 def has_changes(paths: Iterable[Path]) -> bool:
-    for path in paths:
-        rel = str(path.relative_to(REPO_ROOT))
-        diff = run_git(["diff", "--name-only", rel], check=True).stdout.strip()
-        if diff:
-            return True
-    return False
+    return bool(list_changed(paths))
 
 
 def list_changed(paths: Iterable[Path]) -> list[str]:
-    changed: list[str] = []
-    for path in paths:
-        rel = str(path.relative_to(REPO_ROOT))
-        diff = run_git(["diff", "--name-only", rel], check=True).stdout.strip()
-        if diff:
-            changed.append(rel)
-    return changed
+    # One `git diff` over all pathspecs instead of one process per path.
+    rels = [path.relative_to(REPO_ROOT).as_posix() for path in paths]
+    if not rels:
+        return []
+    diff = run_git(["diff", "--name-only", "--", *rels], check=True).stdout
+    diffed = {line.strip() for line in diff.splitlines() if line.strip()}
+    return [
+        rel
+        for rel in rels
+        if rel in diffed or any(name.startswith(rel.rstrip("/") + "/") for name in diffed)
+    ]
 
 
 def commit_if_changed(
@@ -110,19 +152,19 @@ def commit_if_changed(
     label: str,
     dry_run: bool,
 ) -> bool:
-    if not has_changes(paths):
+    paths = list(paths)
+    changed = list_changed(paths)
+    if not changed:
         logger.info("No %s changes detected; skipping commit.", label)
         return False
 
-    changed = list_changed(paths)
     if dry_run:
         logger.info("[dry-run] Would commit (%s): %s", label, message)
         for p in changed:
             logger.info("[dry-run]   - %s", p)
         return True
 
-    for path in paths:
-        run_git(["add", str(path.relative_to(REPO_ROOT))], check=True)
+    run_git(["add", "--", *(path.relative_to(REPO_ROOT).as_posix() for path in paths)], check=True)
     run_git(["commit", "-m", message], check=True)
     return True
 
@@ -184,8 +226,9 @@ def gh_pr_create(
             ".number",
         ]
     )
-    value = result.stdout.strip()
-    return value or None
+    # --jq prints the bare number; tolerate a PR URL as well.
+    value = result.stdout.strip().rsplit("/", 1)[-1].strip()
+    return value if value.isdigit() else None
 
 
 def gh_pr_edit(upstream_repo: str, pr_number: str, body: str, *, dry_run: bool) -> None:
@@ -299,6 +342,7 @@ def ensure_pr(
     if dry_run:
         return "DRY_RUN_PR"
     if created_pr:
+        logger.info("Created PR #%s", created_pr)
         return created_pr
 
     pr_number = None
@@ -317,89 +361,114 @@ def ensure_pr(
 
 
 def is_prerelease(version: str) -> bool:
-    result = bool(re.search(r"(a|b|rc)\d*$", version.lower()))
+    result = bool(_PRERELEASE_RE.search(version))
     logger.info("Is prerelease: %s", result)
     return result
 
 
+def _diff_names(rev_range: str) -> list[str] | None:
+    """NUL-separated ``git diff --name-only`` for a range; None if git fails."""
+    result = subprocess.run(
+        ["git", "diff", "--name-only", "-z", rev_range],
+        cwd=REPO_ROOT,
+        check=False,
+        capture_output=True,
+    )
+    if result.returncode != 0:
+        return None
+    return [p.decode("utf-8", errors="surrogateescape") for p in result.stdout.split(b"\0") if p]
+
+
 def get_changed_files(base_ref: str) -> list[str]:
     base_ref = base_ref.strip()
-    merge_base = run_git(["merge-base", base_ref, "HEAD"], check=False)
-    if merge_base.returncode == 0:
-        base_sha = merge_base.stdout.strip()
-        diff_result = run_git(["diff", "--name-only", f"{base_sha}..HEAD"], check=True)
-    else:
-        diff_result = run_git(["diff", "--name-only", f"{base_ref}..HEAD"], check=False)
-        if diff_result.returncode != 0:
-            diff_result = run_git(["diff", "--name-only", "HEAD~3..HEAD"], check=True)
-    changed_files = [line.strip() for line in diff_result.stdout.splitlines() if line.strip()]
+    base_sha = _git_read(["merge-base", base_ref, "HEAD"], check=False)
+    changed_files = _diff_names(f"{base_sha or base_ref}..HEAD")
+    if changed_files is None and not base_sha:
+        changed_files = _diff_names("HEAD~3..HEAD")
+    if changed_files is None:
+        raise SystemExit(f"git diff --name-only failed for {base_ref}")
     logger.debug("Changed files: %s", changed_files)
     return changed_files
 
 
+def _run_script(script: Path, argv: list[str]) -> None:
+    """Run a sibling script with the current interpreter.
+
+    A separate process keeps the helper's module state (eg the cached pyproject parse)
+    apart from ours while it rewrites files; run_cmd also drops the git read cache.
+    """
+    logger.debug("> Running %s", script.name)
+    run_cmd([sys.executable, str(script), *argv])
+
+
 def run_release_prep(version: str, remote: str) -> None:
-    logger.debug("> Running release_prep.py")
-    run_cmd(
-        [
-            str(Path(__file__).resolve().parent / ".." / ".venv" / "bin" / "python"),
-            str(RELEASE_PREP_SCRIPT),
-            "--version",
-            version,
-            "--fetch-tags",
-            "--remote",
-            remote,
-        ]
+    _run_script(
+        RELEASE_PREP_SCRIPT,
+        ["--version", version, "--fetch-tags", "--remote", remote],
     )
 
 
 def run_update_contributors(repo: str) -> None:
-    logger.debug("> Running update_contributors.py")
-    run_cmd(
-        [
-            str(Path(__file__).resolve().parent / ".." / ".venv" / "bin" / "python"),
-            str(UPDATE_CONTRIBUTORS_SCRIPT),
-            "--source",
-            "github",
-            "--repo",
-            repo,
-            "--output",
-            str(CONTRIBUTORS_PATH),
-        ]
+    _run_script(
+        UPDATE_CONTRIBUTORS_SCRIPT,
+        ["--source", "github", "--repo", repo, "--output", str(CONTRIBUTORS_PATH)],
     )
 
 
 def generate_release_notes(version: str, upstream_ref: str) -> None:
-    tag_result = run_git(["describe", "--tags", "--abbrev=0", upstream_ref], check=False)
-    last_tag = tag_result.stdout.strip() if tag_result.returncode == 0 else None
+    last_tag = _git_read(["describe", "--tags", "--abbrev=0", upstream_ref], check=False) or None
     log_range = f"{last_tag}..HEAD" if last_tag else "HEAD"
 
-    log_result = run_git(
-        ["log", log_range, "--no-merges", "--pretty=format:- %s (%h)"], check=True
-    )
-    changes = log_result.stdout.strip() or "- (no changes found)"
-
     date_str = dt.date.today().isoformat()
     header = f"# Release v{version}\n\n"
     meta = f"Date: {date_str}\n"
     scope = f"Changes since {last_tag}\n\n" if last_tag else "Changes\n\n"
-    RELEASE_NOTES_PATH.write_text(header + meta + scope + changes + "\n", encoding="utf-8")
+
+    # git writes the log straight into the notes file; it never passes through Python.
+    log_args = ["log", log_range, "--no-merges", "--pretty=format:- %s (%h)"]
+    with RELEASE_NOTES_PATH.open("wb") as fh:
+        fh.write((header + meta + scope).encode("utf-8"))
+        fh.flush()
+        start = fh.tell()
+        result = subprocess.run(
+            ["git", *log_args],
+            cwd=REPO_ROOT,
+            check=False,
+            stdout=fh,
+            stderr=subprocess.PIPE,
+            text=True,
+        )
+        if result.returncode != 0:
+            raise SystemExit(f"git {' '.join(log_args)} failed: {result.stderr.strip()}")
+        end = fh.seek(0, os.SEEK_END)
+        if end == start:
+            fh.write(b"- (no changes found)")
+        fh.write(b"\n")
+
+
+_PR_BODY_SUMMARY = "\n".join((
+    "### Summary",
+    "- Bump package version and metadata",
+    "- Refresh contributors list",
+    "- Generate release notes",
+))
+_PR_BODY_CHECKLIST = "\n".join((
+    "### Checklist",
+    "- [ ] CI passes",
+    "- [ ] Release notes look correct",
+    "- [ ] `release` label applied",
+    "- [ ] Tag on merge",
+    "",
+))
 
 
 def build_pr_body(version: str, files_block: str) -> str:
-    return (
-        f"## Release v{version}\n\n"
-        "### Summary\n"
-        "- Bump package version and metadata\n"
-        "- Refresh contributors list\n"
-        "- Generate release notes\n\n"
-        "### Files updated\n"
-        f"{files_block}\n\n"
-        "### Checklist\n"
-        "- [ ] CI passes\n"
-        "- [ ] Release notes look correct\n"
-        "- [ ] `release` label applied\n"
-        "- [ ] Tag on merge\n"
-    )
+    return "\n\n".join((
+        f"## Release v{version}",
+        _PR_BODY_SUMMARY,
+        f"### Files updated\n{files_block}",
+        _PR_BODY_CHECKLIST,
+    ))
 
 
 def main() -> int:
@@ -416,6 +485,11 @@ def main() -> int:
     parser.add_argument("--prep-message", default="chore: prepare release v{version}", help="Commit message for version bump")
     parser.add_argument("--notes-message", default="docs: release notes for v{version}", help="Commit message for release notes")
 
+    parser.add_argument(
+        "--squash-commits",
+        action="store_true",
+        help="Commit contributors, version bump and release notes as one commit.",
+    )
     parser.add_argument(
         "--no-pr",
         action="store_true",
@@ -462,33 +536,55 @@ def main() -> int:
     title = args.pr_title or f"Release v{args.version}"
     initial_body = args.pr_body or build_pr_body(args.version, "- (pending)")
 
+    contributors_message = "docs: update contributors"
+    prep_message = args.prep_message.format(version=args.version)
+    notes_message = args.notes_message.format(version=args.version)
+    release_prep_group = [README_PATH, PYPROJECT_PATH]
+
+    # Tracks whether any step produced release-relevant changes (via list_changed).
+    changed_any = False
+
     # 1) contributors
     run_update_contributors(upstream_repo_full)
-    commit_if_changed(
-        "docs: update contributors",
-        [CONTRIBUTORS_PATH],
-        label="contributor",
-        dry_run=args.dry_run,
-    )
+    if not args.squash_commits:
+        changed_any |= commit_if_changed(
+            contributors_message,
+            [CONTRIBUTORS_PATH],
+            label="contributor",
+            dry_run=args.dry_run,
+        )
 
-    # 2) release prep changes
+    # 2) release prep changes (idempotent: also syncs README and classifiers on reruns)
     run_release_prep(args.version, args.remote_upstream)
-    release_prep_group = [README_PATH, PYPROJECT_PATH]
-    commit_if_changed(
-        args.prep_message.format(version=args.version),
-        release_prep_group,
-        label="release prep",
-        dry_run=args.dry_run,
-    )
+    if not args.squash_commits:
+        changed_any |= commit_if_changed(
+            prep_message,
+            release_prep_group,
+            label="release prep",
+            dry_run=args.dry_run,
+        )
 
     # 3) release notes
     generate_release_notes(args.version, args.base)
-    commit_if_changed(
-        args.notes_message.format(version=args.version),
-        [RELEASE_NOTES_PATH],
-        label="release notes",
-        dry_run=args.dry_run,
-    )
+    if not args.squash_commits:
+        changed_any |= commit_if_changed(
+            notes_message,
+            [RELEASE_NOTES_PATH],
+            label="release notes",
+            dry_run=args.dry_run,
+        )
+    else:
+        changed_any |= commit_if_changed(
+            f"{prep_message}\n\n- {contributors_message}\n- {notes_message}",
+            [CONTRIBUTORS_PATH, *release_prep_group, RELEASE_NOTES_PATH],
+            label="release",
+            dry_run=args.dry_run,
+        )
+
+    if not changed_any:
+        # Nothing to push or describe; skip the gh round trips entirely.
+        logger.info("Already at target version v%s with no release changes; nothing to do.", args.version)
+        return 0
 
     # push early (unless dry-run)
     # Rationale: ensure commits are on the PR branch even if later GitHub API steps fail.
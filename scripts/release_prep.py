@@ -120,7 +120,7 @@ def fetch_tags(remote: str) -> None:
                 print(f"Warning: failed to fetch tags from origin: {fallback_err}")
 
 
-def main() -> None:
+def main(argv: list[str] | None = None) -> None:
     parser = argparse.ArgumentParser(
         description="Prepare release: bump version and generate RELEASE_NOTES.md"
     )
@@ -135,7 +135,7 @@ def main() -> None:
         default="origin",
         help="Remote name for fetching tags (default: origin)",
     )
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
 
     if args.fetch_tags:
         fetch_tags(args.remote)
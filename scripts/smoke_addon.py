@@ -9,10 +9,11 @@ from brkraw_viewer.ui.main import MainWindow
 
 
 def main() -> int:
+    # One Tk root for the whole run; kept unmapped so no window is drawn.
     root = tk.Tk()
-    controller = ViewerController()
-    MainWindow(root, controller)
+    root.withdraw()
     try:
+        MainWindow(root, ViewerController())
         root.update_idletasks()
         root.update()
     finally:
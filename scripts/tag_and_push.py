@@ -3,26 +3,21 @@ from __future__ import annotations
 
 import argparse
 import subprocess
-from pathlib import Path
 import re
 
-try:
-    import tomllib
-except ModuleNotFoundError:  # pragma: no cover
-    import tomli as tomllib
+import _pyproject
 
 
-REPO_ROOT = Path(__file__).resolve().parents[1]
-PYPROJECT_PATH = REPO_ROOT / "pyproject.toml"
+REPO_ROOT = _pyproject.REPO_ROOT
+PYPROJECT_PATH = _pyproject.PYPROJECT_PATH
+_VERSION_CHAR_RE = re.compile(r"[0-9A-Za-z]")
 
 
 def get_version() -> str:
-    text = PYPROJECT_PATH.read_text(encoding="utf-8")
-    data = tomllib.loads(text)
-    version = data.get("project", {}).get("version")
+    version = _pyproject.get_version(PYPROJECT_PATH)
     if not version:
         raise SystemExit("Failed to detect version in pyproject.toml")
-    if not re.search(r"[0-9A-Za-z]", str(version)):
+    if not _VERSION_CHAR_RE.search(str(version)):
         raise SystemExit("Invalid version in pyproject.toml")
     return str(version)
 
@@ -257,7 +257,7 @@ def _parse_source(value: str) -> str:
     raise SystemExit("--source must be 'git' or 'github'.")
 
 
-def main() -> int:
+def main(argv: list[str] | None = None) -> int:
     parser = argparse.ArgumentParser(
         description="Update contributors doc (from local git history or GitHub)."
     )
@@ -281,7 +281,7 @@ def main() -> int:
         default=os.environ.get("GITHUB_TOKEN"),
         help="GitHub token for API access (recommended to avoid rate limits).",
     )
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
 
     source = _parse_source(args.source)
     output_path = Path(args.output)
@@ -2,33 +2,31 @@
 from __future__ import annotations
 
 import os
-import re
 from pathlib import Path
 
-try:
-    import tomllib
-except ModuleNotFoundError:  # pragma: no cover - for Python < 3.11
-    import tomli as tomllib
-
 from packaging.version import parse
 
+import _pyproject
+
 
 def read_version_from_pyproject(pyproject_path: Path) -> str:
-    pyproject = tomllib.loads(pyproject_path.read_text(encoding="utf-8"))
-    version = pyproject.get("project", {}).get("version")
+    version = _pyproject.get_version(pyproject_path)
     if not version:
         raise SystemExit("No version found in pyproject.toml.")
     return version
 
 
 def main() -> int:
-    tag = os.environ["TAG"]
+    tag = os.environ.get("TAG")
+    if not tag:
+        raise SystemExit("TAG environment variable is required.")
     print(f"Target Tag: {tag}")
 
     version = read_version_from_pyproject(Path("pyproject.toml"))
     print(f"Detected Package Version: {version}")
 
-    if parse(tag) != parse(version):
+    # Exact match is the common CI case; only normalize (eg "v1.2.0" vs "1.2") when needed.
+    if tag != version and parse(tag) != parse(version):
         raise SystemExit(f"Tag {tag} does not match package version {version}.")
 
     print("Version check passed!")
@@ -1,4 +1,5 @@
 import logging
+import os
 from pathlib import Path
 from dataclasses import dataclass
 from typing import TYPE_CHECKING, cast, Optional, List, Dict, Tuple
@@ -28,11 +29,13 @@ class DatasetController:
         self._study_info: Dict = {}
         self._scans: Dict[int, ScanLoader] = {}
         self._scan_info: Optional[Dict] = {}
+        self._scan_labels: Dict[int, str] = {}
         self._scan_info_cache: Dict[int, Dict] = {}
         self._hook_name_cache: Dict[int, Optional[str]] = {}
         self._rules_cache: Optional[Dict[str, list]] = None
         self._spec_cache: Dict[tuple[int, str], Optional[str]] = {}
         self._rule_file_cache: Dict[tuple[int, str], tuple[Optional[str], Optional[str]]] = {}
+        self._source_key: Optional[tuple] = None
 
     @property
     def summary(self) -> Optional[DatasetSummary]:
@@ -42,10 +45,16 @@ class DatasetController:
         loader = brkapi.BrukerLoader(path, disable_hook=True)
         self._loader = loader
         self._study_info = loader.subject or {}
-        self._scan_info = self._loader.info(scope="scan", as_dict=True)
         scan_ids = list(loader.avail.keys())
+        source_key = _source_key(path)
+        # Reopening an unchanged dataset (Refresh) keeps the parsed scan info.
+        if source_key is None or source_key != self._source_key or self._scan_info is None:
+            # Scan info is parsed on demand (resolve_scan_info) rather than for every scan up front.
+            self._scan_info = {}
+            self._scan_labels.clear()
+            self._scan_info_cache.clear()
+        self._source_key = source_key
         self._summary = DatasetSummary(path=path, scan_ids=scan_ids)
-        self._scan_info_cache.clear()
         self._hook_name_cache.clear()
         self._rules_cache = None
         self._spec_cache.clear()
@@ -58,7 +67,9 @@ class DatasetController:
         self._study_info = {}
         self._scans.clear()
         self._scan_info = None
+        self._scan_labels.clear()
         self._scan_info_cache.clear()
+        self._source_key = None
         self._hook_name_cache.clear()
         self._rules_cache = None
         self._spec_cache.clear()
@@ -70,21 +81,58 @@ class DatasetController:
         return list(self._summary.scan_ids)
 
     def scan_entries(self) -> list[tuple[int, str]]:
-        if self._loader is None or self._scan_info is None:
+        if self._loader is None or self._scan_info is None or self._summary is None:
             return []
         entries: list[tuple[int, str]] = []
         logger.debug("Build scan entries")
-        for scan_id, info in self._scan_info.items():
-            scan_id = int(scan_id)
-            protocol = _format_value(info.get("Protocol", "N/A"))
-            method = _format_value(info.get("Method", "")).strip()
-            entries.append((scan_id, f"E{scan_id:03d} - {protocol} ({method})"))
+        for scan_id in self._summary.scan_ids:
+            # Labels are formatted once per scan; the list is rebuilt after every label batch.
+            label = self._scan_labels.get(scan_id)
+            if label is None:
+                info = self._scan_info.get(scan_id)
+                if info is None:
+                    entries.append((int(scan_id), f"E{int(scan_id):03d} - ..."))
+                    continue
+                protocol = _format_value(info.get("Protocol", "N/A"))
+                method = _format_value(info.get("Method", "")).strip()
+                label = f"E{int(scan_id):03d} - {protocol} ({method})"
+                self._scan_labels[scan_id] = label
+            entries.append((int(scan_id), label))
         return entries
 
+    def pending_scan_ids(self) -> List[int]:
+        if self._summary is None or self._scan_info is None:
+            return []
+        return [sid for sid in self._summary.scan_ids if sid not in self._scan_info]
+
+    def resolve_scan_info(self, scan_ids: List[int]) -> None:
+        """Parse scan info for the given ids; one loader.info call per batch."""
+        if self._loader is None or self._scan_info is None:
+            return
+        todo = [sid for sid in scan_ids if sid not in self._scan_info]
+        if not todo:
+            return
+        try:
+            info = self._loader.info(scope="scan", scan_id=todo, as_dict=True) or {}
+        except Exception as exc:
+            if len(todo) == 1:
+                logger.warning("Failed to resolve scan info for %s: %s", todo[0], exc)
+                info = {}
+            else:
+                # One bad scan fails the whole batch; retry one by one so only it is lost.
+                logger.debug("Batch scan info failed for %s, retrying per scan: %s", todo, exc)
+                for sid in todo:
+                    self.resolve_scan_info([sid])
+                return
+        for sid in todo:
+            # Failed scans are stored empty so they are not parsed again.
+            self._scan_info[sid] = info.get(sid) or {}
+
     def reco_entries(self, scan_id: int) -> list[tuple[int, str]]:
         entries: List[Tuple[int, str]] = []
         if self._loader is None or self._scan_info is None:
             return entries
+        self.resolve_scan_info([scan_id])
         try:
             scan_info = self._scan_info[scan_id]
         except Exception:
@@ -306,13 +354,35 @@ class DatasetController:
         return dict(self._study_info or {})
 
     def params_summary(self, scan_id: int) -> dict:
-        scan = self.get_scan(scan_id)
-        if scan is None:
-            return {}
+        # Resolved once per scan; reco selection and tab switches reuse it.
+        cached = self.cached_params_summary(scan_id)
+        if cached is not None:
+            return cached
+        summary = _resolve_summary(self.get_scan(scan_id))
+        self.store_params_summary(scan_id, summary)
+        return dict(summary) if isinstance(summary, dict) else summary
+
+    def cached_params_summary(self, scan_id: int) -> Optional[dict]:
+        cached = self._scan_info_cache.get(scan_id)
+        return dict(cached) if cached is not None else None
+
+    @staticmethod
+    def resolve_params_summary(path: Path, scan_id: int) -> dict:
+        """Resolve the scan summary on a private loader; safe to call off the UI thread.
+
+        brkraw loaders and scans cache parsed parameter files lazily and are not
+        thread-safe, so the shared loader is never touched here.
+        """
         try:
-            return brkapi.info_resolver.scan(scan)
-        except Exception:
+            scan = brkapi.BrukerLoader(path, disable_hook=True).get_scan(scan_id)
+        except Exception as exc:
+            logger.warning("Failed to open scan %s for params summary: %s", scan_id, exc)
             return {}
+        return _resolve_summary(scan)
+
+    def store_params_summary(self, scan_id: int, summary: object) -> None:
+        if isinstance(summary, dict) and self._loader is not None:
+            self._scan_info_cache[scan_id] = summary
 
     def search_params(self, scan_id: int, reco_id: int, scope: str, query: str, *, limit: int = 500) -> dict:
         """Search parameters through `BrukerLoader.search_params` and adapt for the UI.
@@ -363,35 +433,42 @@ class DatasetController:
                     pass
             return str(val)
 
-        def _fmt_val_display(val: object) -> str:
+        def _fmt_val_display(val: object, full: str) -> str:
             # Short representation for tree view
             # Handle numpy arrays (duck typing)
             if hasattr(val, "shape"):
                 try:
                     shape = val.shape  # type: ignore
                     if hasattr(shape, "__iter__"):
-                        shape_str = "x".join(str(d) for d in shape)
+                        shape_str = "x".join(map(str, shape))
                         return f"Array of {shape_str}"
                 except Exception:
                     pass
 
-            s = str(val)
-            s = s.replace("\n", " ").replace("\r", "")
-            if len(s) > 30:
-                s = s[:30] + " ..."
-            return s
+            # Without tolist() the full text already is str(val); don't stringify twice.
+            s = str(val) if hasattr(val, "tolist") else full
+            # Only the first 30 characters survive, so clean a short head of long values.
+            head = s[:64].replace("\n", " ").replace("\r", "")
+            if len(head) > 30:
+                return head[:30] + " ..."
+            if len(s) > 64:
+                head = s.replace("\n", " ").replace("\r", "")
+                if len(head) > 30:
+                    return head[:30] + " ..."
+            return head
 
         def _emit(src: str, key_path: str, value: object) -> None:
             nonlocal total
             total += 1
             if len(rows) < limit:
+                full = _fmt_val_full(value)
                 rows.append(
                     {
                         "file": src,
                         "key": key_path,
                         "type": type(value).__name__,
-                        "value": _fmt_val_display(value),
-                        "full_value": _fmt_val_full(value),
+                        "value": _fmt_val_display(value, full),
+                        "full_value": full,
                     }
                 )
 
@@ -466,3 +543,44 @@ class DatasetController:
             return brkapi.addon.map_parameters(scan, spec, transforms, context=context)
         except Exception as exc:
             return {"error": str(exc), "category": category}
+
+
+def _resolve_summary(scan) -> dict:
+    if scan is None:
+        return {}
+    try:
+        return brkapi.info_resolver.scan(scan)
+    except Exception as exc:
+        logger.warning("Failed to resolve params summary: %s", exc)
+        return {}
+
+
+_PARAM_FILES = ("subject", "acqp", "method", "visu_pars", "reco")
+
+
+def _source_key(path: Path) -> Optional[tuple]:
+    """Change key for a dataset: its path plus the mtimes of its parameter files.
+
+    A directory mtime only moves when entries are added or removed, so the
+    parameter files of each scan (and of each ``pdata/<reco>``) are stat'ed too.
+    Archives are keyed on the file itself.
+    """
+    try:
+        resolved = Path(path).resolve()
+        stamps = [resolved.stat().st_mtime_ns]
+        if resolved.is_dir():
+            stack = [(resolved, 0)]
+            while stack:
+                folder, depth = stack.pop()
+                with os.scandir(folder) as it:
+                    for entry in it:
+                        if entry.is_dir(follow_symlinks=False):
+                            if depth < 3:
+                                stack.append((Path(entry.path), depth + 1))
+                            continue
+                        if entry.name in _PARAM_FILES:
+                            stamps.append((entry.path, entry.stat().st_mtime_ns))
+            stamps[1:] = sorted(stamps[1:])
+        return (str(resolved), tuple(stamps))
+    except Exception:
+        return None
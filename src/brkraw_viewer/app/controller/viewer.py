@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import datetime as dt
 import re
+import threading
 from collections import OrderedDict
 from pathlib import Path
 from typing import Optional, Union, Callable, Sequence, cast
@@ -35,6 +36,7 @@ from brkraw import api as brkapi
 from brkraw.core import layout as layout_core
 from brkraw.api.types import SubjectType, SubjectPose, AffineSpace
 from brkraw_viewer.utils.orientation import reorient_to_ras
+from brkraw_viewer.utils.display import estimate_display_window
 from brkraw.api.types import (
     SubjectType,
     SubjectPose,
@@ -46,6 +48,18 @@ import numpy as np
 import logging
 logger = logging.getLogger(__name__)
 
+# Planes larger than this are decimated while a slider is being dragged.
+_SCRUB_PREVIEW_MAX_PIXELS = 256 * 256
+
+# Axis order that makes plane[index] the displayed (row, col) image of a RAS (x, y, z) volume.
+_PLANE_AXES = {"xy": (2, 1, 0), "xz": (1, 2, 0)}
+# Scans whose sidebar labels are resolved per idle tick after a dataset is opened.
+_SCAN_LABEL_BATCH = 8
+# On-disk layout of the timecourse cache; part of the file name so caches written with an
+# older layout are never memory-mapped as this one.
+_TIMECOURSE_CACHE_LAYOUT = "xyzt-c"
+_LEGACY_TIMECOURSE_CACHE_RE = re.compile(r"[0-9a-f]{40}\.npy")
+
 
 class ViewerController:
     def __init__(self, *, dataset: Optional[DatasetController] = None) -> None:
@@ -68,7 +82,20 @@ class ViewerController:
         self._viewer_shape: Optional[tuple[int, ...]] = None
         self._viewer_res: tuple[float, float, float] = (1.0, 1.0, 1.0)
         self._viewer_fov: Optional[tuple[float, float, float]] = None
+        self._viewer_window_source: Optional[object] = None
+        self._viewer_window: Optional[tuple[float, float]] = None
+        self._viewer_generation = 0
+        self._viewer_planes_source: Optional[object] = None
+        self._viewer_planes: dict[tuple[str, int], Optional[np.ndarray]] = {}
+        # Finished plane copies of the previous volume, recycled when the next one has the same layout.
+        self._viewer_plane_pool: dict[tuple[str, int], np.ndarray] = {}
+        self._viewer_plane_first: dict[tuple[str, int], int] = {}
+        self._viewer_frame_source: Optional[object] = None
+        self._viewer_frame_key: Optional[tuple[int, ...]] = None
+        self._viewer_frame_data: Optional[np.ndarray] = None
         self._viewer_job_id: Optional[str] = None
+        self._scan_label_token: Optional[object] = None
+        self._params_summary_token: Optional[object] = None
         self._viewer_hook_enabled = False
         self._viewer_hook_name: Optional[str] = None
         self._viewer_hook_args: Optional[dict] = None
@@ -79,11 +106,16 @@ class ViewerController:
         self._timecourse_cache_path: Optional[str] = None
         self._viewer_space_listeners: list[Callable[[str], None]] = []
         self._timecourse_cache_data: Optional[np.ndarray] = None
+        self._timecourse_frames_data: Optional[np.ndarray] = None
         self._timecourse_cache_job_id: Optional[str] = None
+        self._legacy_timecourse_swept = False
         self._frame_cache: "OrderedDict[int, dict]" = OrderedDict()
         self._frame_cache_limit = 8
         self._pending_frame_requests: dict[str, int] = {}
         self._frame_request_after_id: Optional[str] = None
+        self._slice_render_after_id: Optional[str] = None
+        self._viewer_scrubbing = False
+        self._viewer_status_key: Optional[tuple] = None
         self._convert_hook_enabled: bool = True
         self._viewer_slicepacks = 1
         self._viewer_frames = 1
@@ -103,6 +135,9 @@ class ViewerController:
         self._view.set_viewer_subject_enabled(self.state.viewer.space == "subject_ras")
         self._sync_convert_orientation_from_viewer()
         self._schedule_worker_poll()
+        # Spawn the worker (and its brkraw/numpy imports) once the window is up, so the
+        # first volume load does not pay the process start-up.
+        self._view.schedule_poll(self._worker.start, 0)
 
     def _schedule_worker_poll(self) -> None:
         if self._view is None:
@@ -152,26 +187,35 @@ class ViewerController:
                 popup.finish(success=result.error is None)
             except Exception:
                 pass
+        if self._viewer_job_id and result.job_id != self._viewer_job_id:
+            # Stale load: nothing will adopt its shared segment, so release it here.
+            self._pending_frame_requests.pop(result.job_id, None)
+            _discard_shared_array(result.shm_name)
+            return
         if result.error:
             if self._view is not None:
                 self._view.set_status(f"Load failed: {result.error}")
             return
-        if self._viewer_job_id and result.job_id != self._viewer_job_id:
-            return
         if result.shm_name is None:
             if self._view is not None:
                 self._view.set_status("Load failed: empty result")
             return
         try:
-            from ..workers.shm import read_shared_array
-
-            arr, shm = read_shared_array(result.shm_name, result.shape, result.dtype)
-            data = arr.copy()
-            shm.close()
-            try:
-                shm.unlink()
-            except Exception:
-                pass
+            from ..workers.shm import adopt_shared_array, read_shared_array
+
+            if np.dtype(result.dtype) == np.float64:
+                # float64 only doubles display bandwidth; downcast while copying out.
+                arr, shm = read_shared_array(result.shm_name, result.shape, result.dtype)
+                data = arr.astype(np.float32)
+                del arr
+                shm.close()
+                try:
+                    shm.unlink()
+                except Exception:
+                    pass
+            else:
+                # Keep the worker's shared segment mapped instead of copying the volume.
+                data = adopt_shared_array(result.shm_name, result.shape, result.dtype)
         except Exception as exc:
             if self._view is not None:
                 self._view.set_status(f"Load failed: {exc}")
@@ -202,6 +246,7 @@ class ViewerController:
 
         data = cast(np.ndarray, data)
         self._viewer_volume = data
+        self._seed_viewer_window(data, result.display_range)
         self._viewer_shape = data.shape if hasattr(data, "shape") else None
         if prev_empty or prev_shape != data.shape:
             self._reset_viewer_indices_from_shape(center=True)
@@ -228,6 +273,7 @@ class ViewerController:
                 "frames": self._viewer_frames,
                 "slicepacks": self._viewer_slicepacks,
                 "res": self._viewer_res,
+                "window": self._viewer_window,
             }
             while len(self._frame_cache) > self._frame_cache_limit:
                 self._frame_cache.popitem(last=False)
@@ -263,6 +309,7 @@ class ViewerController:
                 self._view.set_status("Timecourse cache failed.")
             return
         self._timecourse_cache_path = result.cache_path
+        self._timecourse_frames_data = _load_frames_cache(result.frames_path)
         try:
             self._timecourse_cache_data = np.load(result.cache_path, mmap_mode="r")
         except Exception:
@@ -329,10 +376,51 @@ class ViewerController:
             return
         sid = self.state.dataset.selected_scan_id
         if sid is None:
+            self._params_summary_token = None
             self._viewer_fov = None
             self._view.set_params_summary({})
             return
-        summary = self.dataset.params_summary(sid)
+        cached = self.dataset.cached_params_summary(sid)
+        if cached is not None:
+            self._params_summary_token = None
+            self._apply_params_summary(cached)
+            return
+        summary_info = self.dataset.summary
+        if summary_info is None:
+            self._apply_params_summary({})
+            return
+        path = summary_info.path
+        # Parsing method/acqp for a new scan runs in a thread so scan selection stays responsive.
+        token = object()
+        self._params_summary_token = token
+        self._view.set_params_summary({})
+        result: dict = {}
+
+        def _resolve() -> None:
+            # Always set a result, or the poll below would reschedule itself forever.
+            try:
+                result["summary"] = self.dataset.resolve_params_summary(path, sid)
+            except Exception as exc:
+                logger.warning("Params summary failed for scan %s: %s", sid, exc)
+                result["summary"] = {}
+
+        threading.Thread(target=_resolve, daemon=True).start()
+        self._view.schedule_poll(lambda: self._poll_params_summary(token, sid, result), 20)
+
+    def _poll_params_summary(self, token: object, scan_id: int, result: dict) -> None:
+        if token is not self._params_summary_token or self._view is None:
+            return
+        if "summary" not in result:
+            self._view.schedule_poll(lambda: self._poll_params_summary(token, scan_id, result), 20)
+            return
+        self._params_summary_token = None
+        summary = result["summary"]
+        self.dataset.store_params_summary(scan_id, summary)
+        self._apply_params_summary(dict(summary) if isinstance(summary, dict) else summary)
+
+    def _apply_params_summary(self, summary: dict) -> None:
+        if self._view is None:
+            return
         self._view.set_params_summary(summary)
         self._viewer_fov = _parse_fov(summary.get("FOV (mm)") if isinstance(summary, dict) else None)
 
@@ -340,11 +428,8 @@ class ViewerController:
         shape = self._viewer_shape
         if not shape or len(shape) < 3:
             return
-        x, y, z = shape[:3]
         st = self.state.viewer
-        st.x_index = min(max(st.x_index, 0), max(x - 1, 0))
-        st.y_index = min(max(st.y_index, 0), max(y - 1, 0))
-        st.z_index = min(max(st.z_index, 0), max(z - 1, 0))
+        st.x_index, st.y_index, st.z_index = _clamp_xyz(st.x_index, st.y_index, st.z_index, shape)
         if self._viewer_frames > 1:
             st.frame_index = min(max(st.frame_index, 0), max(self._viewer_frames - 1, 0))
         elif len(shape) >= 4:
@@ -373,9 +458,7 @@ class ViewerController:
             else:
                 st.frame_index = 0
         else:
-            st.x_index = min(max(st.x_index, 0), max(x - 1, 0))
-            st.y_index = min(max(st.y_index, 0), max(y - 1, 0))
-            st.z_index = min(max(st.z_index, 0), max(z - 1, 0))
+            st.x_index, st.y_index, st.z_index = _clamp_xyz(st.x_index, st.y_index, st.z_index, shape)
         if self._viewer_frames > 1:
             st.frame_index = min(max(st.frame_index, 0), max(self._viewer_frames - 1, 0))
         elif len(shape) >= 4:
@@ -406,15 +489,7 @@ class ViewerController:
         rgb_candidate = bool(data.ndim == 4 and data.shape[3] == 3)
         extra_dims = list(data.shape[4:]) if data.ndim > 4 else []
         if data.ndim >= 4 and not (rgb_candidate and self.state.viewer.rgb_mode):
-            frame_idx = min(max(self.state.viewer.frame_index, 0), data.shape[3] - 1)
-            slices: list[slice | int] = [slice(None)] * data.ndim
-            slices[3] = frame_idx
-            if extra_dims:
-                extra_indices = self.state.viewer.extra_indices or []
-                for i, size in enumerate(extra_dims):
-                    idx = extra_indices[i] if i < len(extra_indices) else 0
-                    slices[4 + i] = min(max(int(idx), 0), max(int(size) - 1, 0))
-            data = data[tuple(slices)]
+            data = self._resolve_viewer_frame(vol, data, extra_dims)
         rgb_eligible = bool(rgb_candidate)
         if not rgb_eligible and self.state.viewer.rgb_mode:
             self.state.viewer.rgb_mode = False
@@ -423,9 +498,8 @@ class ViewerController:
         if data.ndim < 3:
             return
         x, y, z = data.shape[:3]
-        xi = min(max(self.state.viewer.x_index, 0), x - 1)
-        yi = min(max(self.state.viewer.y_index, 0), y - 1)
-        zi = min(max(self.state.viewer.z_index, 0), z - 1)
+        st = self.state.viewer
+        xi, yi, zi = _clamp_xyz(st.x_index, st.y_index, st.z_index, data.shape)
         frames = self._viewer_frames
         if rgb_eligible and self.state.viewer.rgb_mode:
             frames = 1
@@ -444,12 +518,12 @@ class ViewerController:
         )
         if data.ndim == 4 and data.shape[3] == 3 and self.state.viewer.rgb_mode:
             img_zy = data[xi, :, :, :]              # (y, z, 3)
-            img_xy = data[:, :, zi, :].transpose(1, 0, 2)  # (y, x, 3)
-            img_xz = data[:, yi, :, :].transpose(1, 0, 2)  # (z, x, 3)
+            img_xy = self._resolve_viewer_plane(vol, data, "xy", zi)  # (y, x, 3)
+            img_xz = self._resolve_viewer_plane(vol, data, "xz", yi)  # (z, x, 3)
         else:
             img_zy = data[xi, :, :]                 # (y, z)
-            img_xy = data[:, :, zi].T               # (y, x)
-            img_xz = data[:, yi, :].T               # (z, x)
+            img_xy = self._resolve_viewer_plane(vol, data, "xy", zi)  # (y, x)
+            img_xz = self._resolve_viewer_plane(vol, data, "xz", yi)  # (z, x)
         zoom = max(1.0, float(self.state.viewer.zoom))
         views = {
             "xy": img_xy,
@@ -489,6 +563,30 @@ class ViewerController:
                 overflow_blend = base_blend * ratio_scale
             except Exception:
                 overflow_blend = 0.0
+        value_range = self._resolve_viewer_window(vol)
+        # Slices are immutable per loaded volume, so the viewports can reuse display-ready images.
+        slice_key = (
+            self._viewer_generation,
+            int(self.state.viewer.frame_index),
+            tuple(self.state.viewer.extra_indices or ()),
+            bool(self.state.viewer.rgb_mode),
+        )
+        cache_keys = {
+            "xy": slice_key + ("xy", zi),
+            "xz": slice_key + ("xz", yi),
+            "zy": slice_key + ("zy", xi),
+        }
+        if self._viewer_scrubbing:
+            # Oversized planes are shown 2x decimated while a slider is dragged; release re-renders full res.
+            for plane, img in list(views.items()):
+                if int(img.shape[0]) * int(img.shape[1]) <= _SCRUB_PREVIEW_MAX_PIXELS:
+                    continue
+                views[plane] = img[::2, ::2]
+                row_res, col_res = view_res[plane]
+                view_res[plane] = (row_res * 2.0, col_res * 2.0)
+                row, col = crosshair[plane]
+                crosshair[plane] = (row // 2, col // 2)
+                cache_keys[plane] = cache_keys[plane] + ("preview",)
         self._view.set_viewer_views(
             views,
             indices=(xi, yi, zi),
@@ -499,6 +597,8 @@ class ViewerController:
             allow_overflow=overflow_blend > 0.0,
             overflow_blend=overflow_blend if overflow_blend > 0.0 else None,
             zoom_scale=zoom,
+            value_range=value_range,
+            cache_keys=cache_keys,
         )
         value_text, plot_enabled = _resolve_value_display(
             vol=np.asarray(self._viewer_volume),
@@ -508,8 +608,24 @@ class ViewerController:
             rgb_mode=self.state.viewer.rgb_mode,
         )
         self._view.set_viewer_value_display(value_text, plot_enabled=plot_enabled)
+        if self._viewer_scrubbing:
+            # Secondary widgets are refreshed once the slider is released.
+            return
         self._update_timecourse_plot(indices=(xi, yi, zi))
         if self._view is not None:
+            status_key = (
+                self.state.viewer.space,
+                self._viewer_hook_enabled,
+                zoom,
+                self.state.viewer.rgb_mode,
+                self.state.viewer.show_crosshair,
+                self.state.viewer.slicepack_index,
+                slicepacks,
+            )
+            # The status line only depends on view settings, not on slice indices.
+            if status_key == self._viewer_status_key:
+                return
+            self._viewer_status_key = status_key
             space = self.state.viewer.space
             if space == "subject_ras":
                 space_str = "Subject RAS"
@@ -527,6 +643,96 @@ class ViewerController:
             label = f"Slicepack {self.state.viewer.slicepack_index + 1}/{slicepacks}"
             self._view.set_viewer_status(f"{status} | {label}")
 
+    def _seed_viewer_window(self, vol: object, window: Optional[tuple[float, float]]) -> None:
+        # Window precomputed by the load worker; falls back to _resolve_viewer_window when missing.
+        if window is None:
+            return
+        self._viewer_window_source = vol
+        self._viewer_window = (float(window[0]), float(window[1]))
+        self._viewer_generation += 1
+
+    def _resolve_viewer_window(self, vol: object) -> Optional[tuple[float, float]]:
+        # Display window is computed once per loaded volume and reused for every slice.
+        if vol is not self._viewer_window_source:
+            self._viewer_window_source = vol
+            self._viewer_window = estimate_display_window(np.asarray(vol))
+            self._viewer_generation += 1
+        return self._viewer_window
+
+    def _resolve_viewer_plane(self, vol: object, data: np.ndarray, plane: str, index: int) -> np.ndarray:
+        # X-Y/X-Z slices are transposed strided views of the RAS volume. Once a plane is actually
+        # scrubbed, a contiguous per-axis copy is built on a background thread (NumPy releases
+        # the GIL) and strided views are served until it lands. Also used for RGB volumes
+        # (trailing channel axis kept last). Multi-frame volumes keep strided slicing of the
+        # current frame to avoid a copy per frame.
+        if vol is not self._viewer_planes_source:
+            self._recycle_viewer_planes()
+            self._prune_viewer_plane_pool(data)
+            self._viewer_planes_source = vol
+            self._viewer_plane_first = {}
+        planes = self._viewer_planes
+        key = (plane, data.ndim)
+        cube = planes.get(key)
+        if cube is not None:
+            return cube[index]
+        axes = _PLANE_AXES[plane] + tuple(range(3, data.ndim))
+        view = data.transpose(axes)
+        first = self._viewer_plane_first.setdefault(key, int(index))
+        shape = tuple(getattr(vol, "shape", ()))
+        frame_slice = data.shape != shape and int(np.prod(shape[3:], dtype=np.int64)) > 1
+        if key in planes or first == int(index) or frame_slice:
+            return view[index]
+        planes[key] = None
+        buf = self._viewer_plane_pool.pop(key, None)
+        if buf is not None and (buf.shape != view.shape or buf.dtype != view.dtype):
+            buf = None
+        threading.Thread(target=_fill_viewer_plane, args=(planes, key, view, buf), daemon=True).start()
+        return view[index]
+
+    def _recycle_viewer_planes(self) -> None:
+        # Only finished copies are pooled; pending ones are still being written by their thread.
+        # The pool holds at most one buffer per key, replacing any older one.
+        recycled = False
+        for key, cube in self._viewer_planes.items():
+            if cube is not None:
+                self._viewer_plane_pool[key] = cube
+                recycled = True
+        self._viewer_planes = {}
+        if recycled and self._view is not None:
+            # Viewports keep the last drawn slice (a view into a cube) for redraws; drop it
+            # before the buffer is refilled in place with another volume.
+            self._view.set_viewer_views({})
+
+    def _prune_viewer_plane_pool(self, data: np.ndarray) -> None:
+        # Keep only buffers that fit the incoming volume; others would just pin memory.
+        for key, buf in list(self._viewer_plane_pool.items()):
+            plane, ndim = key
+            axes = _PLANE_AXES[plane] + tuple(range(3, ndim))
+            if ndim != data.ndim or buf.dtype != data.dtype or buf.shape != tuple(data.shape[a] for a in axes):
+                del self._viewer_plane_pool[key]
+
+    def _resolve_viewer_frame(self, vol: object, data: np.ndarray, extra_dims: list[int]) -> np.ndarray:
+        # The displayed 3D frame only changes with the frame/extra indices; keep its view
+        # across slice scrubs instead of re-indexing the full volume on every render.
+        frame_idx = min(max(self.state.viewer.frame_index, 0), data.shape[3] - 1)
+        extra_indices = self.state.viewer.extra_indices or []
+        extra = tuple(
+            min(max(int(extra_indices[i]) if i < len(extra_indices) else 0, 0), max(int(size) - 1, 0))
+            for i, size in enumerate(extra_dims)
+        )
+        key = (int(frame_idx),) + extra
+        if (
+            vol is self._viewer_frame_source
+            and key == self._viewer_frame_key
+            and self._viewer_frame_data is not None
+        ):
+            return self._viewer_frame_data
+        frame = data[(slice(None),) * 3 + key]
+        self._viewer_frame_source = vol
+        self._viewer_frame_key = key
+        self._viewer_frame_data = frame
+        return frame
+
     def _clear_viewer_volume(self, *, status: Optional[str] = None) -> None:
         self._viewer_volume = None
         self._viewer_raw_volume = None
@@ -534,6 +740,15 @@ class ViewerController:
         self._viewer_shape = None
         self._viewer_res = (1.0, 1.0, 1.0)
         self._viewer_fov = None
+        self._viewer_window_source = None
+        self._viewer_window = None
+        self._viewer_planes_source = None
+        self._recycle_viewer_planes()
+        self._viewer_plane_first = {}
+        self._viewer_frame_source = None
+        self._viewer_frame_key = None
+        self._viewer_frame_data = None
+        self._viewer_status_key = None
         self._clear_frame_cache()
         if self._view is None:
             return
@@ -623,6 +838,7 @@ class ViewerController:
             scan_id=int(sid),
             reco_id=int(rid),
             cache_path=cache_path,
+            frames_path=_timecourse_frames_path(cache_path),
             slicepack_index=self.state.viewer.slicepack_index,
             space=self.state.viewer.space,
             subject_type=self.state.viewer.subject_type if self.state.viewer.space == "subject_ras" else None,
@@ -722,16 +938,21 @@ class ViewerController:
             str(int(self.state.viewer.slicepack_index)),
         ]
         key = hashlib.sha1("|".join(parts).encode("utf-8")).hexdigest()
-        return str(base / f"{key}.npy")
+        if not self._legacy_timecourse_swept:
+            self._legacy_timecourse_swept = True
+            _remove_legacy_timecourse_caches(base)
+        return str(base / f"{key}.{_TIMECOURSE_CACHE_LAYOUT}.npy")
 
     def _clear_timecourse_cache(self) -> None:
         if self._timecourse_cache_path:
-            try:
-                Path(self._timecourse_cache_path).unlink(missing_ok=True)
-            except Exception:
-                pass
+            for path in (self._timecourse_cache_path, _timecourse_frames_path(self._timecourse_cache_path)):
+                try:
+                    Path(path).unlink(missing_ok=True)
+                except Exception:
+                    pass
         self._timecourse_cache_path = None
         self._timecourse_cache_data = None
+        self._timecourse_frames_data = None
         self._timecourse_cache_job_id = None
 
     def _clear_frame_cache(self) -> None:
@@ -762,6 +983,25 @@ class ViewerController:
             return
         self._frame_request_after_id = _after(120, self._flush_frame_request)
 
+    def _schedule_slice_render(self) -> None:
+        # Coalesce rapid slider/zoom/click events so only the latest state is rendered (~60 Hz).
+        _after = getattr(self._view, "after", None) if self._view is not None else None
+        if _after is None:
+            self._render_viewer_views()
+            return
+        if self._slice_render_after_id:
+            try:
+                _after_cancel = getattr(self._view, "after_cancel", None)
+                if _after_cancel:
+                    _after_cancel(self._slice_render_after_id)
+            except Exception:
+                pass
+        self._slice_render_after_id = _after(16, self._flush_slice_render)
+
+    def _flush_slice_render(self) -> None:
+        self._slice_render_after_id = None
+        self._render_viewer_views()
+
     def _flush_frame_request(self) -> None:
         self._frame_request_after_id = None
         self._request_viewer_volume()
@@ -772,6 +1012,7 @@ class ViewerController:
         entry = self._frame_cache.pop(frame_index)
         self._frame_cache[frame_index] = entry
         self._viewer_volume = entry.get("volume")
+        self._seed_viewer_window(self._viewer_volume, entry.get("window"))
         self._viewer_raw_volume = entry.get("raw")
         self._viewer_raw_affine = entry.get("affine")
         self._viewer_shape = entry.get("shape")
@@ -779,7 +1020,39 @@ class ViewerController:
         self._viewer_slicepacks = entry.get("slicepacks", self._viewer_slicepacks)
         self._viewer_res = entry.get("res", self._viewer_res)
         self._update_viewer_indices_from_shape()
-        self._render_viewer_views()
+        self._schedule_slice_render()
+        return True
+
+    def _apply_mapped_frame(self, frame_index: int) -> bool:
+        # Once the full volume is cached on disk for the timecourse, frames are served from the
+        # frame-major copy written next to it, where each frame is one contiguous run of the
+        # memory map, instead of a worker load per frame. The voxel-major timecourse cache
+        # itself is never used here: a frame of it is strided across the whole file. The worker
+        # skips the copy for large series, which then keep loading frames through the worker.
+        frames = self._timecourse_frames_data
+        shape = self._viewer_shape
+        if frames is None or shape is None or self._viewer_volume is None or frames.ndim < 4:
+            return False
+        if int(frames.shape[0]) != self._viewer_frames or not 0 <= int(frame_index) < int(frames.shape[0]):
+            return False
+        if self._timecourse_cache_path != self._resolve_timecourse_cache_path():
+            return False
+        frame = frames[int(frame_index)]
+        if frame.dtype == np.float64:
+            # Match worker loads, which hand float64 volumes over as float32.
+            frame = np.asarray(frame, dtype=np.float32)
+        if tuple(frame.shape) != tuple(shape):
+            frame = frame[:, :, :, np.newaxis]
+            if tuple(frame.shape) != tuple(shape):
+                return False
+        self._viewer_volume = frame
+        # Keep the current display window: estimating a new one would read the whole frame from
+        # disk, which is exactly what the memory map avoids.
+        self._seed_viewer_window(frame, self._viewer_window)
+        # No raw frame to re-orient from; flip/space changes fall back to a worker load.
+        self._viewer_raw_volume = None
+        self._update_viewer_indices_from_shape()
+        self._schedule_slice_render()
         return True
 
     def _refresh_hook_state_for_scan(self, scan_id: int) -> None:
@@ -1010,8 +1283,30 @@ class ViewerController:
             self.action_select_scan(scan_entries[0][0])
         else:
             self._clear_viewer_volume(status="No image loaded.")
+        self._schedule_scan_label_fill()
+
+    def _schedule_scan_label_fill(self) -> None:
+        # Labels of scans not parsed yet are filled in a batch per tick, so opening a large
+        # study only parses the selected scan before the UI is usable.
+        token = object()
+        self._scan_label_token = token
+        if self._view is not None and self.dataset.pending_scan_ids():
+            self._view.schedule_poll(lambda: self._fill_scan_labels(token), 0)
+
+    def _fill_scan_labels(self, token: object) -> None:
+        if token is not self._scan_label_token or self._view is None:
+            return
+        pending = self.dataset.pending_scan_ids()
+        if not pending:
+            return
+        self.dataset.resolve_scan_info(pending[:_SCAN_LABEL_BATCH])
+        # Only the relabelled rows change; a full list reset would also scroll back to the selection.
+        self._view.update_scan_labels(self.dataset.scan_entries())
+        if len(pending) > _SCAN_LABEL_BATCH:
+            self._view.schedule_poll(lambda: self._fill_scan_labels(token), 0)
 
     def action_close_dataset(self) -> None:
+        self._scan_label_token = None
         self.dataset.close_dataset()
         self._convert_layout_cache_key = None
         self.state.dataset.path = None
@@ -1025,6 +1320,7 @@ class ViewerController:
         self.state.viewer.hook_locked = False
         self._clear_timecourse_cache()
         self._clear_viewer_volume(status="No dataset open.")
+        self._viewer_plane_pool = {}
         self._sync_view()
         self._update_params_summary()
         self._update_subject_summary()
@@ -1042,16 +1338,16 @@ class ViewerController:
         self.dataset.materialize_scan(int(scan_id))
         if self._view is not None:
             self._view.set_status(f"Selected scan: {scan_id}")
+        reco_entries = self.dataset.reco_entries(int(scan_id))
         # Avoid full _sync_view to prevent redundant scan list rebuilds.
         if self._view is not None:
-            self._view.set_reco_list(self.dataset.reco_entries(int(scan_id)))
+            self._view.set_reco_list(reco_entries)
             self._view.set_scan_selected(int(scan_id))
             self._view.set_reco_selected(None)
+        # Study/subject info is per dataset and is pushed on open/close only.
         self._update_params_summary()
-        self._update_subject_summary()
         self._refresh_hook_state_for_scan(int(scan_id))
         self._refresh_convert_layout()
-        reco_entries = self.dataset.reco_entries(int(scan_id))
         if reco_entries:
             self.action_select_reco(reco_entries[0][0])
 
@@ -1067,8 +1363,7 @@ class ViewerController:
         self._apply_subject_defaults_from_reco()
         if self._view is not None:
             self._view.set_reco_selected(int(reco_id))
-        self._update_params_summary()
-        self._update_subject_summary()
+        # Params summary is per scan and was already pushed by action_select_scan.
         self._refresh_convert_layout()
         self._request_viewer_volume()
 
@@ -1128,6 +1423,8 @@ class ViewerController:
                     self.action_select_reco(int(current_reco))
             except Exception:
                 pass
+        if current_path:
+            self._schedule_scan_label_fill()
         if self._view is not None and current_tab:
             try:
                 self._view.select_tab(current_tab)
@@ -1196,6 +1493,8 @@ class ViewerController:
     def on_tab_built(self, title: str) -> None:
         if title != "Viewer":
             return
+        # A freshly built tab has an empty status bar.
+        self._viewer_status_key = None
         if self._viewer_volume is not None:
             self._schedule_viewer_render(0)
             self._schedule_viewer_render(120)
@@ -1271,15 +1570,24 @@ class ViewerController:
 
     def on_viewer_axis_change(self, axis: str, value: int) -> None:
         st = self.state.viewer
-        if axis == "x":
-            st.x_index = int(value)
-        elif axis == "y":
-            st.y_index = int(value)
-        elif axis == "z":
-            st.z_index = int(value)
-        self._render_viewer_views()
+        attr = {"x": "x_index", "y": "y_index", "z": "z_index"}.get(axis)
+        if attr is None:
+            self._schedule_slice_render()
+            return
+        # Scales report every drag step, including ones that round to the current slice.
+        if getattr(st, attr) == int(value):
+            return
+        setattr(st, attr, int(value))
+        self._schedule_slice_render()
+
+    def on_viewer_scrub(self, active: bool) -> None:
+        self._viewer_scrubbing = bool(active)
+        if not self._viewer_scrubbing and self._viewer_volume is not None:
+            self._schedule_slice_render()
 
     def on_viewer_frame_change(self, value: int) -> None:
+        if self.state.viewer.frame_index == int(value):
+            return
         self.state.viewer.frame_index = int(value)
         if self._timecourse_plot is not None:
             try:
@@ -1287,10 +1595,12 @@ class ViewerController:
             except Exception:
                 pass
         if self._viewer_hook_enabled:
-            self._render_viewer_views()
+            self._schedule_slice_render()
         else:
             if self._apply_cached_frame(self.state.viewer.frame_index):
                 return
+            if self._apply_mapped_frame(self.state.viewer.frame_index):
+                return
             self._schedule_frame_request()
 
     def on_viewer_hook_toggle(self, enabled: bool, hook_name: Optional[str]) -> None:
@@ -1389,15 +1699,20 @@ class ViewerController:
             return
         if len(st.extra_indices) <= index:
             st.extra_indices.extend([0] * (index + 1 - len(st.extra_indices)))
+        elif st.extra_indices[index] == int(value):
+            return
         st.extra_indices[index] = int(value)
-        self._render_viewer_views()
+        self._schedule_slice_render()
 
     def on_viewer_jump(self, x: int, y: int, z: int) -> None:
         st = self.state.viewer
+        if self._viewer_shape and len(self._viewer_shape) >= 3:
+            # Edge clicks land on the last voxel instead of leaving the state out of range.
+            x, y, z = _clamp_xyz(x, y, z, self._viewer_shape)
         st.x_index = int(x)
         st.y_index = int(y)
         st.z_index = int(z)
-        self._render_viewer_views()
+        self._schedule_slice_render()
 
     def on_viewer_crosshair_toggle(self, enabled: bool) -> None:
         self.state.viewer.show_crosshair = bool(enabled)
@@ -1414,7 +1729,7 @@ class ViewerController:
             self.state.viewer.zoom = 1.0
         if self._view is not None:
             self._view.set_viewer_zoom_value(self.state.viewer.zoom)
-        self._render_viewer_views()
+        self._schedule_slice_render()
 
     def on_viewer_zoom_step(self, delta: float, plane: Optional[str] = None, rc: Optional[tuple[int, int]] = None) -> None:
         try:
@@ -1445,7 +1760,7 @@ class ViewerController:
         self.state.viewer.zoom = new_zoom
         if self._view is not None:
             self._view.set_viewer_zoom_value(new_zoom)
-        self._render_viewer_views()
+        self._schedule_slice_render()
 
     def on_viewer_resize(self) -> None:
         self._render_viewer_views()
@@ -1471,6 +1786,8 @@ class ViewerController:
                     self._timecourse_cache_data = np.load(cache_path, mmap_mode="r")
                 except Exception:
                     self._timecourse_cache_data = None
+                if self._timecourse_frames_data is None:
+                    self._timecourse_frames_data = _load_frames_cache(_timecourse_frames_path(cache_path))
             if self._timecourse_cache_data is not None:
                 self._update_timecourse_plot()
                 return
@@ -1637,13 +1954,12 @@ class ViewerController:
             self._timecourse_plot.set_message("Timecourse unavailable.")
             return
         try:
-            y = np.asarray(series).astype(float)
+            # One contiguous float64 gather; the plotter maps it to pixels without per-sample Python work.
+            y = np.asarray(series, dtype=np.float64).reshape(-1)
         except Exception:
             self._timecourse_plot.set_message("Timecourse unavailable.")
             return
-        if y.ndim != 1:
-            y = y.reshape(-1)
-        x = list(range(len(y)))
+        x = range(len(y))
         meta = PlotMeta(title="Voxel timecourse", x_label="Frame", y_label="") if PlotMeta else None
         self._timecourse_plot.set_lines(
             x=x,
@@ -2120,6 +2436,37 @@ class ViewerController:
             return np.asarray(raw)
 
 
+def _fill_viewer_plane(
+    planes: dict[tuple[str, int], Optional[np.ndarray]],
+    key: tuple[str, int],
+    view: np.ndarray,
+    buf: Optional[np.ndarray] = None,
+) -> None:
+    # Runs off the Tk thread; a volume switch replaces the dict, so late copies are dropped.
+    try:
+        if buf is None:
+            planes[key] = np.ascontiguousarray(view)
+        else:
+            np.copyto(buf, view)
+            planes[key] = buf
+    except Exception:
+        # Leave the pending marker so a failed copy (e.g. MemoryError) is not retried per slice.
+        pass
+
+
+def _discard_shared_array(name: Optional[str]) -> None:
+    if not name:
+        return
+    try:
+        from multiprocessing import shared_memory
+
+        shm = shared_memory.SharedMemory(name=name)
+        shm.close()
+        shm.unlink()
+    except Exception:
+        pass
+
+
 def _affine_to_resolution(affine: np.ndarray) -> tuple[float, float, float]:
     if affine.ndim != 2 or affine.shape[0] < 3 or affine.shape[1] < 3:
         return (1.0, 1.0, 1.0)
@@ -2199,6 +2546,42 @@ def _resolve_value_display(
         return ("[ - ]", plot_enabled)
 
 
+def _remove_legacy_timecourse_caches(base: Path) -> None:
+    # Caches written before the layout tag was added to the name ({sha1}.npy, Fortran order)
+    # are never read again; drop them rather than leave full-size volumes behind.
+    try:
+        paths = list(base.glob("*.npy"))
+    except Exception:
+        return
+    for path in paths:
+        if _LEGACY_TIMECOURSE_CACHE_RE.fullmatch(path.name):
+            try:
+                path.unlink(missing_ok=True)
+            except Exception:
+                pass
+
+
+def _timecourse_frames_path(cache_path: str) -> str:
+    return str(Path(cache_path).with_suffix("")) + ".frames-txyz.npy"
+
+
+def _load_frames_cache(path: Optional[str]) -> Optional[np.ndarray]:
+    if not path or not Path(path).exists():
+        return None
+    try:
+        return np.load(path, mmap_mode="r")
+    except Exception:
+        return None
+
+
+def _clamp_xyz(x: int, y: int, z: int, shape: Sequence[int]) -> tuple[int, int, int]:
+    return (
+        min(max(int(x), 0), max(int(shape[0]) - 1, 0)),
+        min(max(int(y), 0), max(int(shape[1]) - 1, 0)),
+        min(max(int(z), 0), max(int(shape[2]) - 1, 0)),
+    )
+
+
 def _parse_fov(value: object) -> Optional[tuple[float, float, float]]:
     if value is None:
         return None
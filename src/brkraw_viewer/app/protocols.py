@@ -17,6 +17,7 @@ class ViewerView(Protocol):
     def set_status(self, text: str) -> None: ...
     def set_dataset_path(self, path: Optional[Path]) -> None: ...
     def set_scan_list(self, scan_ids: list[tuple[int, str]]) -> None: ...
+    def update_scan_labels(self, scan_ids: list[tuple[int, str]]) -> None: ...
     def set_reco_list(self, reco_ids: Sequence[tuple[int, str]] | Sequence[int]) -> None: ...
     def schedule_poll(self, callback: Callable[[], None], interval_ms: int) -> None: ...
     def open_worker_popup(self, log_queue, title: str) -> TaskPopup | None: ...
@@ -38,6 +39,8 @@ class ViewerView(Protocol):
         allow_overflow: bool = False,
         overflow_blend: float | None = None,
         zoom_scale: float | None = None,
+        value_range: tuple[float, float] | None = None,
+        cache_keys: dict | None = None,
     ) -> None: ...
     def set_viewer_subject_enabled(self, enabled: bool) -> None: ...
     def set_viewer_status(self, text: str) -> None: ...
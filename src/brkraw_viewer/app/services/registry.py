@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Any, Dict, Iterable, List, Optional, Tuple, Mapping
@@ -16,6 +17,8 @@ from .viewer_config import registry_path
 
 logger = logging.getLogger("brkraw.viewer")
 
+_REGISTER_WORKERS = 8
+
 
 @dataclass(frozen=True)
 class RegistryEntry:
@@ -196,6 +199,14 @@ def build_entry(path: Path) -> RegistryEntry:
     )
 
 
+def _try_build_entry(path: Path) -> Optional[RegistryEntry]:
+    try:
+        return build_entry(path)
+    except Exception as exc:
+        logger.warning("Failed to register %s: %s", path, exc)
+        return None
+
+
 def _merge_entries(
     existing: Dict[str, Dict[str, Any]],
     new_entries: Iterable[RegistryEntry],
@@ -220,14 +231,20 @@ def register_paths(
     registry_file: Optional[str | Path] = None,
 ) -> Tuple[int, int]:
     existing = {entry.get("path", ""): entry for entry in load_registry(root=root, registry_file=registry_file)}
+    paths = list(paths)
     new_entries: List[RegistryEntry] = []
     skipped = 0
-    for path in paths:
-        try:
-            new_entries.append(build_entry(path))
-        except Exception as exc:
-            logger.warning("Failed to register %s: %s", path, exc)
+    if len(paths) > 1:
+        # Opening a dataset is mostly file I/O, so loaders overlap well across threads.
+        with ThreadPoolExecutor(max_workers=min(_REGISTER_WORKERS, len(paths))) as pool:
+            results = list(pool.map(_try_build_entry, paths))
+    else:
+        results = [_try_build_entry(path) for path in paths]
+    for entry in results:
+        if entry is None:
             skipped += 1
+        else:
+            new_entries.append(entry)
     merged, added = _merge_entries(existing, new_entries)
     write_registry(merged.values(), root=root, registry_file=registry_file)
     return added, skipped
@@ -241,11 +258,10 @@ def unregister_paths(
     entries = {entry.get("path", ""): entry for entry in load_registry(root=root, registry_file=registry_file)}
     removed = 0
     for path in paths:
-        norm = normalize_path(path)
-        if norm in entries:
-            entries.pop(norm, None)
+        if entries.pop(normalize_path(path), None) is not None:
             removed += 1
-    write_registry(entries.values(), root=root, registry_file=registry_file)
+    if removed:
+        write_registry(entries.values(), root=root, registry_file=registry_file)
     return removed
 
 
@@ -4,7 +4,9 @@ import json
 import logging
 import logging.handlers
 import multiprocessing
+import queue
 import sys
+from collections import deque
 from typing import Optional, cast
 from pathlib import Path
 
@@ -25,9 +27,13 @@ from .protocol import (
 )
 from ..services import registry as registry_service
 from .shm import create_shared_array
+from brkraw_viewer.utils.display import estimate_display_window
 
 logger = logging.getLogger("brkraw.worker")
 _loader_cache: dict[str, brkapi.BrukerLoader] = {}
+# Largest frame-major copy written next to a timecourse cache; bigger series keep
+# loading frames through the worker instead of doubling their disk footprint.
+_FRAMES_CACHE_MAX_BYTES = 512 * 1024 * 1024
 
 
 class _StreamToLogger:
@@ -116,15 +122,31 @@ def run_worker(
 
     logger.info("Worker started.")
 
+    # Requests already pulled off the queue while looking for newer volume loads.
+    backlog: deque = deque()
     while True:
         try:
-            task = input_queue.get()
+            task = backlog.popleft() if backlog else input_queue.get()
             if task is None:
                 break
             if isinstance(task, ConvertRequest):
                 _process_convert(task, output_queue)
                 continue
             if isinstance(task, LoadVolumeRequest):
+                if _has_newer_load(input_queue, backlog):
+                    # The viewer only applies its latest load (eg while scrubbing frames).
+                    logger.debug("Skip superseded volume load: job=%s", task.job_id)
+                    output_queue.put(
+                        LoadVolumeResult(
+                            job_id=task.job_id,
+                            shm_name=None,
+                            shape=(),
+                            dtype="",
+                            frames=1,
+                            error="Superseded by a newer load request",
+                        )
+                    )
+                    continue
                 _process_load_volume(task, output_queue)
                 continue
             if isinstance(task, TimecourseCacheRequest):
@@ -139,6 +161,15 @@ def run_worker(
     logger.info("Worker stopped.")
 
 
+def _has_newer_load(input_queue: multiprocessing.Queue, backlog: deque) -> bool:
+    while True:
+        try:
+            backlog.append(input_queue.get_nowait())
+        except queue.Empty:
+            break
+    return any(isinstance(item, LoadVolumeRequest) for item in backlog)
+
+
 def _process_convert(task: ConvertRequest, output_queue: multiprocessing.Queue) -> None:
     saved: list[str] = []
     try:
@@ -166,6 +197,7 @@ def _process_convert(task: ConvertRequest, output_queue: multiprocessing.Queue)
             return
 
         images = list(nii) if isinstance(nii, tuple) else [nii]
+        del nii
         if len(images) != len(task.output_paths):
             logger.warning(
                 "Output count mismatch: expected %d, got %d",
@@ -187,6 +219,9 @@ def _process_convert(task: ConvertRequest, output_queue: multiprocessing.Queue)
                 logger.warning("Output %d (%s) does not support to_filename and is not callable.", i + 1, type(img))
                 continue
             saved.append(dest)
+            # Drop each written image so multi-output scans do not hold every volume until the end.
+            images[i] = None
+            img = None
 
         if task.sidecar_enabled:
             logger.info(
@@ -379,17 +414,28 @@ def _process_load_volume(task: LoadVolumeRequest, output_queue: multiprocessing.
                 affine = getattr(affine, "tolist", lambda: affine)()
             except Exception:
                 pass
-        shm_name = create_shared_array(data)
+        # Display prep runs here, off the UI process: halve float64 payloads and
+        # estimate the display window before handing the volume over. The volume is
+        # streamed into shared memory slice by slice rather than materialized first.
+        if not hasattr(data, "shape") or not hasattr(data, "dtype"):
+            data = np.asarray(data)
+        out_dtype = np.dtype(np.float32) if np.dtype(data.dtype) == np.float64 else np.dtype(data.dtype)
+        try:
+            display_range = estimate_display_window(data)
+        except Exception:
+            display_range = None
+        shm_name = create_shared_array(data, dtype=out_dtype)
         output_queue.put(
             LoadVolumeResult(
                 job_id=task.job_id,
                 shm_name=shm_name,
-                shape=cast(np.ndarray, data).shape,
-                dtype=str(data.dtype),
+                shape=tuple(int(n) for n in data.shape),
+                dtype=str(out_dtype),
                 affine=affine,
                 slicepacks=slicepacks,
                 frames=frames,
                 error=None,
+                display_range=display_range,
             )
         )
     except Exception as exc:
@@ -472,7 +518,38 @@ def _process_timecourse_cache(task: TimecourseCacheRequest, output_queue: multip
             frames = 1
         cache_path = Path(task.cache_path)
         cache_path.parent.mkdir(parents=True, exist_ok=True)
-        np.save(cache_path, data, allow_pickle=False)
+        frames_path: Optional[str] = None
+        if data.ndim >= 4:
+            # Write C order slab by slab so each voxel's timecourse is one contiguous run
+            # in the mmap'd cache (np.save keeps Fortran order, striding frames by the volume size).
+            # This gives up contiguous per-frame reads: one frame is strided by T across the
+            # whole file. The layout is tagged in the file name by the controller.
+            out = np.lib.format.open_memmap(cache_path, mode="w+", dtype=data.dtype, shape=data.shape)
+            for i in range(data.shape[0]):
+                out[i] = data[i]
+            out.flush()
+            del out
+            # Frames are stored as the load path hands them over (float64 halved to float32).
+            frames_dtype = np.dtype(np.float32) if np.dtype(data.dtype) == np.float64 else np.dtype(data.dtype)
+            frames_nbytes = int(data.size) * frames_dtype.itemsize
+            if task.frames_path and frames_nbytes > _FRAMES_CACHE_MAX_BYTES:
+                logger.debug("Frame cache skipped: %d bytes over limit", frames_nbytes)
+            elif task.frames_path:
+                # Frame-major (t, x, y, z, ...) copy for serving single frames: each frame is
+                # one contiguous run, so a frame view pages in only its own bytes.
+                frames_shape = (data.shape[3],) + data.shape[:3] + data.shape[4:]
+                try:
+                    out = np.lib.format.open_memmap(task.frames_path, mode="w+", dtype=frames_dtype, shape=frames_shape)
+                    for t in range(data.shape[3]):
+                        out[t] = data[:, :, :, t]
+                    out.flush()
+                    del out
+                    frames_path = task.frames_path
+                except Exception as exc:
+                    # Frame serving is optional; the timecourse cache itself is still valid.
+                    logger.warning("Frame cache failed: %s", exc)
+        else:
+            np.save(cache_path, data, allow_pickle=False)
         logger.debug("Timecourse cache saved: path=%s shape=%s dtype=%s", cache_path, data.shape, data.dtype)
         output_queue.put(
             TimecourseCacheResult(
@@ -482,6 +559,7 @@ def _process_timecourse_cache(task: TimecourseCacheRequest, output_queue: multip
                 dtype=str(data.dtype),
                 frames=frames,
                 error=None,
+                frames_path=frames_path,
             )
         )
     except Exception as exc:
@@ -58,6 +58,7 @@ class LoadVolumeResult:
     slicepacks: int = 1
     frames: int = 1
     error: Optional[str] = None
+    display_range: Optional[Tuple[float, float]] = None
 
 
 @dataclass(frozen=True)
@@ -68,6 +69,7 @@ class TimecourseCacheRequest:
     reco_id: int
     cache_path: str
     slicepack_index: int = 0
+    frames_path: Optional[str] = None
     space: str = "scanner"
     subject_type: Optional[str] = None
     subject_pose: Optional[str] = None
@@ -84,6 +86,7 @@ class TimecourseCacheResult:
     dtype: str
     frames: int = 1
     error: Optional[str] = None
+    frames_path: Optional[str] = None
 
 
 @dataclass(frozen=True)
@@ -2,15 +2,28 @@ from __future__ import annotations
 
 import multiprocessing.shared_memory
 from multiprocessing import resource_tracker
-from typing import Tuple
+from typing import Optional, Tuple
 
 import numpy as np
 
 
-def create_shared_array(array: np.ndarray) -> str:
-    shm = multiprocessing.shared_memory.SharedMemory(create=True, size=array.nbytes)
-    view = np.ndarray(array.shape, dtype=array.dtype, buffer=shm.buf)
-    view[:] = array
+def create_shared_array(array: np.ndarray, *, dtype: Optional[np.dtype] = None) -> str:
+    """Copy ``array`` into a new shared segment, optionally casting to ``dtype``.
+
+    Lazy array proxies and casts are filled one last-axis slice at a time, so the
+    source never needs a full in-memory (or full-size converted) copy.
+    """
+    shape = tuple(int(n) for n in array.shape)
+    out_dtype = np.dtype(dtype if dtype is not None else array.dtype)
+    nbytes = max(int(np.prod(shape, dtype=np.int64)) * out_dtype.itemsize, 1)
+    shm = multiprocessing.shared_memory.SharedMemory(create=True, size=nbytes)
+    view = np.ndarray(shape, dtype=out_dtype, buffer=shm.buf)
+    if len(shape) >= 3 and (not isinstance(array, np.ndarray) or array.dtype != out_dtype):
+        for k in range(shape[-1]):
+            view[..., k] = array[..., k]
+    else:
+        view[...] = np.asarray(array)
+    del view
     name = shm.name
     try:
         shm.close()
@@ -27,3 +40,30 @@ def read_shared_array(name: str, shape: Tuple[int, ...], dtype: str) -> Tuple[np
     shm = multiprocessing.shared_memory.SharedMemory(name=name)
     arr = np.ndarray(shape, dtype=np.dtype(dtype), buffer=shm.buf)
     return arr, shm
+
+
+class _SharedBlock:
+    # Exposes a shared segment through __array_interface__ so arrays built from it
+    # keep the segment mapped for as long as any view is alive.
+    def __init__(self, shm: multiprocessing.shared_memory.SharedMemory, shape: Tuple[int, ...], dtype: str) -> None:
+        self._shm = shm
+        self._view: np.ndarray | None = np.ndarray(shape, dtype=np.dtype(dtype), buffer=shm.buf)
+        self.__array_interface__ = self._view.__array_interface__
+
+    def __del__(self) -> None:
+        self._view = None
+        try:
+            self._shm.close()
+        except Exception:
+            pass
+
+
+def adopt_shared_array(name: str, shape: Tuple[int, ...], dtype: str) -> np.ndarray:
+    """Map a shared array without copying; the segment name is unlinked immediately."""
+    shm = multiprocessing.shared_memory.SharedMemory(name=name)
+    arr = np.asarray(_SharedBlock(shm, shape, dtype))
+    try:
+        shm.unlink()
+    except Exception:
+        pass
+    return arr
@@ -1,7 +1,8 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Callable, Optional, Tuple, List
+from functools import lru_cache
+from typing import Callable, Iterable, Optional, Set, Tuple, List
 from .viewport import ViewportCanvas
 import numpy as np
 from numpy.typing import DTypeLike
@@ -13,6 +14,33 @@ LabelChangedCallback = Callable[[np.ndarray], None]
 StrokeEndCallback = Callable[[Tuple[int, int, int, int, int, int]], None]
 
 
+# Elements per slab for whole-volume scans; bounds the temporary bool mask.
+_RELABEL_SLAB_ELEMS = 1 << 22
+
+
+def _relabel_inplace(arr: np.ndarray, old: int, new: int, clear: Optional[int] = None) -> None:
+    """Write `new` wherever `arr == old`, slab by slab along the first axis.
+
+    With `clear` set, pixels already carrying `new` are first reset to `clear`
+    in the same slab pass (replace instead of merge).
+    """
+    if arr.ndim < 3 or arr.size <= _RELABEL_SLAB_ELEMS:
+        slabs = [arr]
+    else:
+        step = max(1, _RELABEL_SLAB_ELEMS // max(1, arr[0].size))
+        slabs = [arr[i : i + step] for i in range(0, arr.shape[0], step)]
+    for slab in slabs:
+        hit = slab == old
+        if clear is not None:
+            np.putmask(slab, slab == new, clear)
+        np.putmask(slab, hit, new)
+
+
+@lru_cache(maxsize=512)
+def _rgb_hex(r: int, g: int, b: int) -> str:
+    return f"#{r:02x}{g:02x}{b:02x}"
+
+
 @dataclass
 class Brush:
     radius: int = 6
@@ -60,7 +88,13 @@ class LabelMapPainter:
 
         # RGBA lookup table: index -> color.
         # index 0 should be transparent.
-        self.lut_rgba: np.ndarray = self.default_lut_rgba(256)
+        # Bumped on every LUT assignment; keys the hover color cache.
+        self._lut_version: int = 0
+        self._lut: np.ndarray
+        self.lut_rgba = self.default_lut_rgba(256)
+        self._hex_cache: Tuple[int, int, str] = (-1, -1, "")
+        self._display_lut_key: Tuple[int, int] = (-1, -1)
+        self._display_lut_arr: Optional[np.ndarray] = None
 
         # Overlay alpha applied to non-zero labels if LUT alpha is 255.
         self.alpha: int = 180  # 0..255
@@ -74,13 +108,24 @@ class LabelMapPainter:
         self._paint_value: int = self.active_label
         self._last_rc: Optional[Tuple[int, int]] = None
         self._dirty_bbox: Optional[List[int]] = None
+        # Area painted since the last throttled flush (subset of the stroke bbox).
+        self._flush_bbox: Optional[List[int]] = None
+        # Last composited overlay; partial refreshes patch it in place.
+        self._rgba: Optional[np.ndarray] = None
 
         # Real-time overlay refresh (throttled)
         self.throttle_ms: int = 33  # ~30 FPS
         self._flush_after_id: Optional[str] = None
         self._flush_pending: bool = False
+        # Coalesced (after_idle) overlay refresh for LUT/relabel edits.
+        # None means a full recomposite is pending.
+        self._refresh_after_id: Optional[str] = None
+        self._refresh_labels: Optional[Set[int]] = set()
         # Event binding ids returned by viewport.bind_canvas
         self._bind_ids: List[str] = []
+        # Brush preview hooks resolved once in attach() (None if unsupported).
+        self._set_preview: Optional[Callable[..., None]] = None
+        self._clear_preview: Optional[Callable[[], None]] = None
     # ---------- Viewport binding ----------
 
     def attach(self) -> None:
@@ -92,6 +137,11 @@ class LabelMapPainter:
         # Avoid double-binding.
         self.detach()
 
+        set_prev = getattr(self._vp, "set_brush_preview", None)
+        clr_prev = getattr(self._vp, "clear_brush_preview", None)
+        self._set_preview = set_prev if callable(set_prev) else None
+        self._clear_preview = clr_prev if callable(clr_prev) else None
+
         # Use the viewport's bind_canvas helper so we work with embedded/detached tabs.
         self._bind_ids = []
         try:
@@ -226,12 +276,29 @@ class LabelMapPainter:
                 raise ValueError("shape must be 'circle' or 'square'")
             self.brush.shape = shape
 
-    def set_lut_rgba(self, lut_rgba: np.ndarray) -> None:
-        lut = np.asarray(lut_rgba, dtype=np.uint8)
-        if lut.ndim != 2 or lut.shape[1] != 4:
+    @property
+    def lut_rgba(self) -> np.ndarray:
+        """RGBA lookup table, a validated (N>=1, 4) uint8 array.
+
+        Returned as a read-only view: derived tables are cached per LUT version, so
+        in-place edits would go unseen. Assign a new table or use `set_label_color(s)`.
+        The setter stores a copy, so the caller's array is never aliased.
+        """
+        view = self._lut.view()
+        view.setflags(write=False)
+        return view
+
+    @lut_rgba.setter
+    def lut_rgba(self, lut_rgba: np.ndarray) -> None:
+        lut = np.array(lut_rgba, dtype=np.uint8, copy=True)
+        if lut.ndim != 2 or lut.shape[1] != 4 or lut.shape[0] == 0:
             raise ValueError("lut_rgba must be (N,4) uint8")
-        self.lut_rgba = lut
-        self.refresh_overlay_full()
+        self._lut = lut
+        self._lut_version += 1
+
+    def set_lut_rgba(self, lut_rgba: np.ndarray) -> None:
+        self.lut_rgba = lut_rgba
+        self._request_refresh()
 
     def set_label_color(self, label: int, rgb: Tuple[int, int, int], *, alpha: int = 255) -> None:
         """Set a single label color in the RGBA LUT.
@@ -242,11 +309,9 @@ class LabelMapPainter:
         if idx < 0:
             return
 
-        lut = np.asarray(self.lut_rgba, dtype=np.uint8)
-        if lut.ndim != 2 or lut.shape[1] != 4:
-            raise ValueError("lut_rgba must be (N,4) uint8")
-
-        if idx >= lut.shape[0]:
+        lut = self._lut
+        grown = idx >= lut.shape[0]
+        if grown:
             n = idx + 1
             new_lut = np.zeros((n, 4), dtype=np.uint8)
             new_lut[: lut.shape[0]] = lut
@@ -265,20 +330,111 @@ class LabelMapPainter:
             lut[idx] = np.array([r, g, b, a], dtype=np.uint8)
 
         self.lut_rgba = lut
-        self.refresh_overlay_full()
+        self._request_refresh(None if grown else (idx,))
         # Color pickers often steal focus; restore it and refresh the hover preview.
         self._restore_focus_to_viewport()
         self.refresh_preview_at_pointer()
 
+    def set_label_colors(self, labels: Iterable[int], rgba: np.ndarray) -> None:
+        """Set many label colors at once from an (N,4) uint8 block (eg a restored palette)."""
+        ids = np.asarray(list(labels), dtype=np.int64).ravel()
+        block = np.clip(np.asarray(rgba, dtype=np.int64).reshape(-1, 4), 0, 255).astype(np.uint8)
+        if block.shape[0] != ids.size:
+            raise ValueError("rgba must have one row per label")
+        keep = ids >= 0
+        ids, block = ids[keep], block[keep]
+        if ids.size == 0:
+            return
+        lut = self._lut
+        grown = int(ids.max()) >= lut.shape[0]
+        if grown:
+            new_lut = np.zeros((int(ids.max()) + 1, 4), dtype=np.uint8)
+            new_lut[: lut.shape[0]] = lut
+            lut = new_lut
+        lut[ids] = block
+        lut[0] = 0
+        self.lut_rgba = lut
+        self._request_refresh(None if grown else ids.tolist())
+
+    def relabel(self, old: int, new: int, *, replace: bool = False) -> None:
+        """Replace every `old` label with `new` in place (whole volume when bound).
+
+        By default existing `new` pixels are kept (merge); with `replace=True` they
+        are erased first so only the former `old` region carries `new`.
+        """
+        target = self.label_volume if self.label_volume is not None else self.label_map
+        if target is None or int(old) == int(new):
+            return
+        clear = int(self.erase_label) if replace else None
+        _relabel_inplace(target, int(old), int(new), clear)
+        ids = (int(new),) if clear is None else (int(new), clear)
+        self._request_refresh(ids)
+
+    def delete_label(self, label: int) -> None:
+        """Erase every pixel carrying `label` (sets it to the erase label)."""
+        self.relabel(label, self.erase_label)
+
     def clear(self) -> None:
         self.label_map = None
+        self._rgba = None
         self._vp.set_overlay_rgba(None)
 
     def refresh_overlay_full(self) -> None:
+        self._refresh_labels = set()
         if self.label_map is None:
             return
-        rgba = self.labels_to_rgba(self.label_map)
-        self._vp.set_overlay_rgba(rgba)
+        self._rgba = self.labels_to_rgba(self.label_map, out=self._rgba)
+        self._vp.set_overlay_rgba(self._rgba)
+
+    def refresh_overlay_region(self, bbox: Tuple[int, int, int, int]) -> None:
+        """Recomposite only the (r0, c0, r1, c1) region of the overlay (inclusive)."""
+        lm, out = self.label_map, self._rgba
+        if lm is None or out is None or out.shape[:2] != lm.shape:
+            self.refresh_overlay_full()
+            return
+        r0, c0, r1, c1 = (int(v) for v in bbox)
+        region = (slice(max(r0, 0), r1 + 1), slice(max(c0, 0), c1 + 1))
+        out[region] = self.labels_to_rgba(lm[region])
+        self._vp.set_overlay_rgba(out)
+
+    def refresh_overlay_for_labels(self, labels) -> None:
+        """Recomposite only the pixels currently carrying one of `labels`."""
+        lm, out = self.label_map, self._rgba
+        if lm is None or out is None or out.shape[:2] != lm.shape:
+            self.refresh_overlay_full()
+            return
+        ids = [int(v) for v in labels]
+        mask = lm == ids[0] if len(ids) == 1 else np.isin(lm, ids)
+        hits = lm[mask]
+        if hits.size:
+            out[mask] = self.labels_to_rgba(hits[np.newaxis, :])[0]
+        self._vp.set_overlay_rgba(out)
+
+    def _request_refresh(self, labels: Optional[Iterable[int]] = None) -> None:
+        """Coalesce overlay refreshes from a burst of edits into one idle callback.
+
+        `labels` limits the recomposite to those ids; None forces a full refresh.
+        """
+        if labels is None:
+            self._refresh_labels = None
+        elif self._refresh_labels is not None:
+            self._refresh_labels.update(int(v) for v in labels)
+        if self._refresh_after_id is not None:
+            return
+        try:
+            self._refresh_after_id = str(self._vp.after_idle(self._flush_refresh))
+        except Exception:
+            self._refresh_after_id = None
+            self._flush_refresh()
+
+    def _flush_refresh(self) -> None:
+        self._refresh_after_id = None
+        labels = self._refresh_labels
+        self._refresh_labels = set()
+        if labels is None:
+            self.refresh_overlay_full()
+        elif labels:
+            self.refresh_overlay_for_labels(labels)
 
     def _request_flush(self) -> None:
         """Schedule a throttled overlay refresh while painting."""
@@ -300,27 +456,31 @@ class LabelMapPainter:
         if not self._flush_pending:
             return
         self._flush_pending = False
+        bbox = self._flush_bbox
+        self._flush_bbox = None
         if self.label_map is None:
             return
-        rgba = self.labels_to_rgba(self.label_map)
-        self._vp.set_overlay_rgba(rgba)
+        if bbox is None:
+            self.refresh_overlay_full()
+        else:
+            self.refresh_overlay_region((bbox[0], bbox[1], bbox[2], bbox[3]))
 
     # ---------- Hover preview ----------
 
     def _active_label_hex(self) -> str:
         """Return the active label color as a hex string (#RRGGBB)."""
         idx = int(self.active_label)
-        lut = np.asarray(self.lut_rgba, dtype=np.uint8)
-        if lut.ndim != 2 or lut.shape[1] != 4 or lut.shape[0] == 0:
-            return "#ffcc00"
+        c_idx, c_ver, c_hex = self._hex_cache
+        if c_idx == idx and c_ver == self._lut_version:
+            return c_hex
+        lut = self._lut
         if idx < 0:
             idx = 0
         if idx >= lut.shape[0]:
             idx = lut.shape[0] - 1
-        r = int(lut[idx, 0])
-        g = int(lut[idx, 1])
-        b = int(lut[idx, 2])
-        return f"#{r:02x}{g:02x}{b:02x}"
+        hx = _rgb_hex(int(lut[idx, 0]), int(lut[idx, 1]), int(lut[idx, 2]))
+        self._hex_cache = (int(self.active_label), self._lut_version, hx)
+        return hx
     
     def _vp_canvas_widget(self):
         """Best-effort access to the underlying Tk Canvas used by the viewport."""
@@ -391,37 +551,21 @@ class LabelMapPainter:
                 pass
 
     def _on_hover_move(self, event) -> None:
-        if not self.enabled:
+        # Hot path (every <Motion>): preview hooks were resolved in attach().
+        set_prev = self._set_preview
+        if not self.enabled or set_prev is None:
             return
-        rc = self._vp.canvas_to_image(int(event.x), int(event.y))
+        rc = self._vp.canvas_to_image(event.x, event.y)
         if rc is None:
             self._on_hover_leave(event)
             return
-
-        set_prev = getattr(self._vp, "set_brush_preview", None)
-        if not callable(set_prev):
-            return
-
-        try:
-            set_prev(
-                int(rc[0]),
-                int(rc[1]),
-                size=int(self.brush.radius),
-                shape=str(self.brush.shape),
-                color=self._active_label_hex(),
-                show=True,
-            )
-        except Exception:
-            # Best-effort only
-            return
+        brush = self.brush
+        set_prev(rc[0], rc[1], size=brush.radius, shape=brush.shape, color=self._active_label_hex(), show=True)
 
     def _on_hover_leave(self, _event=None) -> None:
-        clr = getattr(self._vp, "clear_brush_preview", None)
-        if callable(clr):
-            try:
-                clr()
-            except Exception:
-                pass
+        clr = self._clear_preview
+        if clr is not None:
+            clr()
 
     def _on_hover_enter(self, _event=None) -> None:
         # After returning from modal dialogs (eg color picker), <Motion> may not fire.
@@ -429,33 +573,31 @@ class LabelMapPainter:
 
     # ---------- Rendering ----------
 
-    def labels_to_rgba(self, labels: np.ndarray) -> np.ndarray:
+    def _display_lut(self) -> np.ndarray:
+        """LUT with the overlay alpha policy applied: 0 transparent, others capped at `alpha`."""
+        key = (self._lut_version, int(self.alpha))
+        if self._display_lut_key != key or self._display_lut_arr is None:
+            lut = self._lut.copy()
+            cap = min(max(int(self.alpha), 0), 255)
+            np.minimum(lut[:, 3], cap, out=lut[:, 3])
+            lut[0, 3] = 0
+            self._display_lut_arr = lut
+            self._display_lut_key = key
+        return self._display_lut_arr
+
+    def labels_to_rgba(self, labels: np.ndarray, *, out: Optional[np.ndarray] = None) -> np.ndarray:
+        """Map a 2D label array to RGBA; `out` (H,W,4 uint8) is reused when it fits."""
         labels_i = np.asarray(labels)
         if labels_i.ndim != 2:
             raise ValueError("labels must be 2D")
-
-        h, w = labels_i.shape
-        out = np.zeros((h, w, 4), dtype=np.uint8)
-
-        lut = self.lut_rgba
-        max_idx = int(lut.shape[0] - 1)
-
-        idx = labels_i.astype(np.int32, copy=False)
-        if max_idx >= 0:
-            idx = np.clip(idx, 0, max_idx)
-
-        rgba = lut[idx]
-        out[:, :, :] = rgba
-
-        # Enforce alpha policy: 0 transparent, others get self.alpha unless LUT already has alpha < 255.
-        nonzero = idx != 0
-        if np.any(nonzero):
-            # If LUT alpha is 255, cap with self.alpha. If LUT alpha is already smaller, keep it.
-            a = out[:, :, 3].astype(np.int16, copy=False)
-            a_nz = a[nonzero]
-            a_nz = np.minimum(a_nz, int(self.alpha))
-            out[nonzero, 3] = a_nz.astype(np.uint8)
-        out[~nonzero, 3] = 0
+        if not np.issubdtype(labels_i.dtype, np.integer):
+            labels_i = labels_i.astype(np.int32)
+
+        shape = labels_i.shape + (4,)
+        if out is None or out.shape != shape or out.dtype != np.uint8:
+            out = np.empty(shape, dtype=np.uint8)
+        # Alpha policy lives in the LUT, so a single clipped gather does the whole job.
+        np.take(self._display_lut(), labels_i, axis=0, out=out, mode="clip")
         return out
 
     # ---------- Painting ----------
@@ -522,12 +664,16 @@ class LabelMapPainter:
                 pass
             self._flush_after_id = None
         self._flush_pending = False
+        self._flush_bbox = None
 
         # Final refresh overlay
         bbox: Optional[Tuple[int, int, int, int]] = None
         if self._dirty_bbox is not None:
             bbox = (self._dirty_bbox[0], self._dirty_bbox[1], self._dirty_bbox[2], self._dirty_bbox[3])
-        self.refresh_overlay_full()
+        if bbox is not None:
+            self.refresh_overlay_region(bbox)
+        else:
+            self.refresh_overlay_full()
         if bbox is not None and self.on_stroke_end is not None:
             try:
                 ax = int(self.slice_axis)
@@ -619,6 +765,13 @@ class LabelMapPainter:
         return (r0, c0, r1, c1)
 
     def _mark_dirty(self, bbox: Tuple[int, int, int, int]) -> None:
+        if self._flush_bbox is None:
+            self._flush_bbox = [bbox[0], bbox[1], bbox[2], bbox[3]]
+        else:
+            self._flush_bbox[0] = min(self._flush_bbox[0], bbox[0])
+            self._flush_bbox[1] = min(self._flush_bbox[1], bbox[1])
+            self._flush_bbox[2] = max(self._flush_bbox[2], bbox[2])
+            self._flush_bbox[3] = max(self._flush_bbox[3], bbox[3])
         if self._dirty_bbox is None:
             self._dirty_bbox = [bbox[0], bbox[1], bbox[2], bbox[3]]
             return
@@ -637,11 +790,9 @@ class LabelMapPainter:
         Indices 1..n-1 get pseudo-distinct colors.
         """
         n = max(1, int(n))
-        lut = np.zeros((n, 4), dtype=np.uint8)
-        lut[0] = np.array([0, 0, 0, 0], dtype=np.uint8)
-        for i in range(1, n):
-            r = (37 * i) % 255
-            g = (91 * i) % 255
-            b = (173 * i) % 255
-            lut[i] = np.array([r, g, b, 255], dtype=np.uint8)
+        i = np.arange(n, dtype=np.int64)[:, None]
+        lut = np.empty((n, 4), dtype=np.uint8)
+        lut[:, :3] = (i * np.array([37, 91, 173], dtype=np.int64)) % 255
+        lut[:, 3] = 255
+        lut[0] = 0
         return lut
\ No newline at end of file
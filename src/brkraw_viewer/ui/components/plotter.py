@@ -9,6 +9,8 @@ from typing import Callable, Iterable, List, Optional, Sequence, Tuple
 import tkinter as tk
 from tkinter import ttk
 
+import numpy as np
+
 
 # ----------------------------
 # Small, fast plotter component
@@ -472,25 +474,30 @@ class PlotCanvas(ttk.Frame):
 
         self._draw_grid(l, t, r, b)
 
-        x = self._x
-        ys = self._ys
-
-        n = min(len(x), *(len(y) for y in ys))
+        n = min(len(self._x), *(len(y) for y in self._ys))
         if n <= 1:
             self._draw_message(l, t, r, b)
             return
+        # One float64 array per trace so limits and pixel mapping below are vectorized.
+        x = np.asarray(self._x[:n], dtype=np.float64)
+        ys = [np.asarray(y[:n], dtype=np.float64) for y in self._ys]
 
         # Determine limits
         if self._xlim is not None:
             x_min, x_max = float(self._xlim[0]), float(self._xlim[1])
         else:
-            x_min, x_max = float(min(x[:n])), float(max(x[:n]))
+            x_min, x_max = float(x.min()), float(x.max())
 
         if self._ylim is not None:
             y_min, y_max = float(self._ylim[0]), float(self._ylim[1])
         else:
-            y_min = float(min(min(y[:n]) for y in ys))
-            y_max = float(max(max(y[:n]) for y in ys))
+            finite = [y[np.isfinite(y)] for y in ys]
+            finite = [y for y in finite if y.size]
+            if not finite:
+                self._draw_message(l, t, r, b)
+                return
+            y_min = float(min(y.min() for y in finite))
+            y_max = float(max(y.max() for y in finite))
 
         if x_max == x_min:
             x_max = x_min + 1.0
@@ -518,32 +525,31 @@ class PlotCanvas(ttk.Frame):
         # Downsample
         plot_w = max(1, r - l)
         max_points = int(plot_w * self.max_points_factor)
-        idx = _downsample_indices(n, max_points)
+        idx = np.asarray(_downsample_indices(n, max_points), dtype=np.intp)
 
-        # Precompute x pixel positions
         def x_to_px(v: float) -> int:
             return l + int((v - x_min) * (r - l) / (x_max - x_min))
 
-        def y_to_py(v: float) -> int:
-            return b - int((v - y_min) * (b - t) / (y_max - y_min))
-
         # Clip helper
         def in_xrange(v: float) -> bool:
             if not self._invert_x:
                 return x_min <= v <= x_max
             return x_max <= v <= x_min
 
+        # Pixel positions for every sampled point at once (truncated like int()).
+        xs = x[idx]
+        x_lo, x_hi = min(x_min, x_max), max(x_min, x_max)
+        keep = (xs >= x_lo) & (xs <= x_hi)
+        px = (l + (xs - x_min) * (r - l) / (x_max - x_min)).astype(np.int64)
+
         c = self._canvas
         for trace_i, y in enumerate(ys):
             style = self._line_styles[trace_i] if trace_i < len(self._line_styles) else LineStyle()
 
-            pts: list[int] = []
-            for k in idx:
-                xv = float(x[k])
-                if not in_xrange(xv):
-                    continue
-                yv = float(y[k])
-                pts.extend([x_to_px(xv), y_to_py(yv)])
+            yv = y[idx]
+            mask = keep & np.isfinite(yv)
+            py = b - ((yv[mask] - y_min) * (b - t) / (y_max - y_min)).astype(np.int64)
+            pts = np.column_stack((px[mask], py)).ravel().tolist()
 
             if len(pts) >= 4:
                 c.create_line(*pts, fill=style.color, width=style.width, smooth=False)
@@ -551,8 +557,8 @@ class PlotCanvas(ttk.Frame):
         if self._vline_x is not None:
             xv = float(self._vline_x)
             if in_xrange(xv):
-                px = x_to_px(xv)
-                c.create_line(px, t, px, b, fill=self.theme.tick, dash=(2, 3), width=1)
+                px_v = x_to_px(xv)
+                c.create_line(px_v, t, px_v, b, fill=self.theme.tick, dash=(2, 3), width=1)
         self._last_plot_bounds = (l, t, r, b)
         self._last_x_bounds = (x_min, x_max)
 
@@ -3,12 +3,15 @@ from __future__ import annotations
 import tkinter as tk
 from tkinter import ttk
 from pathlib import Path
-from dataclasses import dataclass
-from typing import Callable, Optional, Tuple, Dict, List
+from collections import OrderedDict
+from dataclasses import dataclass, replace
+from typing import Callable, Optional, Tuple, Dict, List, Union
 
 import numpy as np
 from PIL import Image, ImageTk, ImageDraw
 
+from brkraw_viewer.utils.display import histogram_window, window_to_uint8
+
 from ..assets import load_icon
 from .icon_button import IconButton
 
@@ -17,6 +20,9 @@ ClickCallback = Callable[[int, int], None]
 ZoomCallback = Callable[[float, Optional[Tuple[int, int]]], None]
 ScrollCallback = Callable[[int], None]
 
+# Auto-window fallback estimates larger planes from a stride-2 subsample.
+_AUTO_WINDOW_FULL_PIXELS = 256 * 256
+
 
 @dataclass(frozen=True)
 class OverlaySpec:
@@ -41,6 +47,8 @@ class ColorbarWidget(ttk.Frame):
 
         self._tk_img: Optional[ImageTk.PhotoImage] = None
         self._img_id: Optional[int] = None
+        self._border_id: Optional[int] = None
+        self._grad_key: Optional[Tuple[int, int]] = None
         self._text_ids: List[int] = []
 
         self._lut: Optional[np.ndarray] = None
@@ -56,25 +64,38 @@ class ColorbarWidget(ttk.Frame):
         ticks: List[Tuple[float, str]],
         label: str = "",
     ) -> None:
-        self._lut = np.asarray(lut, dtype=np.uint8)
-        self._ticks = list(ticks)
-        self._label = str(label)
+        lut_arr = np.asarray(lut, dtype=np.uint8)
+        ticks = list(ticks)
+        label = str(label)
+        same_lut = self._lut is not None and np.array_equal(lut_arr, self._lut)
+        if same_lut and ticks == self._ticks and label == self._label:
+            return
+        if not same_lut:
+            self._grad_key = None
+        self._lut = lut_arr
+        self._ticks = ticks
+        self._label = label
         self._render()
 
     def clear(self) -> None:
+        if self._lut is None and self._img_id is None:
+            return
         self._lut = None
         self._ticks = []
         self._label = ""
         self._canvas.delete("all")
         self._tk_img = None
         self._img_id = None
+        self._border_id = None
+        self._grad_key = None
         self._text_ids = []
 
     def _on_resize(self, *_: object) -> None:
         self._render()
 
     def _render(self) -> None:
-        self._canvas.delete("all")
+        # Gradient and border items persist across renders; only ticks/labels are redrawn.
+        self._canvas.delete("ticks")
         self._text_ids = []
         w = max(self._canvas.winfo_width(), 1)
         h = max(self._canvas.winfo_height(), 1)
@@ -90,23 +111,32 @@ class ColorbarWidget(ttk.Frame):
         y1 = y0 + bar_h
 
         # gradient image (top=max, bottom=min)
-        grad = np.zeros((bar_h, bar_w, 3), dtype=np.uint8)
-        ramp = np.linspace(255, 0, bar_h, dtype=np.int32)
-        grad[:, :, :] = self._lut[ramp][:, None, :]
-
-        pil = Image.fromarray(grad, mode="RGB")
-        self._tk_img = ImageTk.PhotoImage(pil)
-        self._img_id = self._canvas.create_image(x0, y0, anchor="nw", image=self._tk_img)
+        if self._grad_key != (bar_h, bar_w) or self._tk_img is None:
+            # Every pixel is written below, so skip the zero fill.
+            grad = np.empty((bar_h, bar_w, 3), dtype=np.uint8)
+            ramp = np.linspace(255, 0, bar_h, dtype=np.int32)
+            grad[:, :, :] = self._lut[ramp][:, None, :]
+
+            pil = Image.fromarray(grad, mode="RGB")
+            self._tk_img = ImageTk.PhotoImage(pil)
+            self._grad_key = (bar_h, bar_w)
+        if self._img_id is None:
+            self._img_id = self._canvas.create_image(x0, y0, anchor="nw", image=self._tk_img)
+        else:
+            self._canvas.itemconfigure(self._img_id, image=self._tk_img)
 
         # border
-        self._canvas.create_rectangle(x0, y0, x1, y1, outline="#444444", width=1)
+        if self._border_id is None:
+            self._border_id = self._canvas.create_rectangle(x0, y0, x1, y1, outline="#444444", width=1)
+        else:
+            self._canvas.coords(self._border_id, x0, y0, x1, y1)
 
         # ticks: tick position expects 0..1 (normalized). controller can map values to 0..1.
         for t, txt in self._ticks:
             tt = float(t)
             tt = 0.0 if tt < 0.0 else 1.0 if tt > 1.0 else tt
             yy = y0 + int(round((1.0 - tt) * (bar_h - 1)))
-            self._canvas.create_line(x1 + 2, yy, x1 + 8, yy, fill="#dddddd", width=1)
+            self._canvas.create_line(x1 + 2, yy, x1 + 8, yy, fill="#dddddd", width=1, tags=("ticks",))
             tid = self._canvas.create_text(
                 x1 + 10,
                 yy,
@@ -114,6 +144,7 @@ class ColorbarWidget(ttk.Frame):
                 fill="#dddddd",
                 text=str(txt),
                 font=("TkDefaultFont", 9),
+                tags=("ticks",),
             )
             self._text_ids.append(tid)
 
@@ -125,6 +156,7 @@ class ColorbarWidget(ttk.Frame):
                 fill="#dddddd",
                 text=self._label,
                 font=("TkDefaultFont", 9, "bold"),
+                tags=("ticks",),
             )
 
 
@@ -153,18 +185,23 @@ class ViewportCanvas(ttk.Frame):
         self._colorbar.pack(side="top", fill="y", expand=True, padx=(6, 6), pady=(6, 6))
 
         self._tk_img: Optional[ImageTk.PhotoImage] = None
+        self._tk_img_spec: Optional[Tuple[str, Tuple[int, int]]] = None
+        self._tk_img_key: Optional[tuple] = None
         self._img_id: Optional[int] = None
         self._title_id: Optional[int] = None
+        self._crosshair_ids: Optional[Tuple[int, int]] = None
         self._capture_icon: Optional[tk.PhotoImage] = None
 
         # Independent RGBA overlay layer (e.g., label painting)
         self._overlay_rgba: Optional[np.ndarray] = None  # (H, W, 4) uint8
         self._overlay_tk_img: Optional[ImageTk.PhotoImage] = None
+        self._overlay_tk_spec: Optional[Tuple[int, int]] = None
         self._overlay_img_id: Optional[int] = None
 
         # Brush preview (shadow) drawn as a small RGBA image patch (pixel-accurate, NEAREST).
         self._brush_preview_tk_img: Optional[ImageTk.PhotoImage] = None
         self._brush_preview_img_id: Optional[int] = None
+        self._brush_preview_key: Optional[tuple] = None
 
         self._click_cb: Optional[ClickCallback] = None
         self._zoom_cb: Optional[ZoomCallback] = None
@@ -197,6 +234,18 @@ class ViewportCanvas(ttk.Frame):
         self._allow_upsample: bool = True
         self._lock_mm_per_px: Optional[float] = None
         self._allow_overflow: bool = False
+        self._value_range: Optional[Tuple[float, float]] = None
+        # reusable flat scratch pools for base -> uint8 conversion (grown to the largest plane seen)
+        self._u8_pool = np.empty(0, dtype=np.uint8)
+        self._f32_pool = np.empty(0, dtype=np.float32)
+        # same for the parametric overlay: LUT indices, blended RGB output and blend scratch
+        self._ov_idx_pool = np.empty(0, dtype=np.uint8)
+        self._ov_rgb_pool = np.empty(0, dtype=np.uint8)
+        self._ov_f32_pool = np.empty(0, dtype=np.float32)
+        # display-ready RGB slices keyed by the caller's cache_key (LRU)
+        self._cache_key: Optional[tuple] = None
+        self._rgb_cache: "OrderedDict[tuple, np.ndarray]" = OrderedDict()
+        self._rgb_cache_limit = 64
 
         self._canvas.bind("<Configure>", self._on_resize)
         self._canvas.bind("<Button-1>", self._on_click)
@@ -331,6 +380,7 @@ class ViewportCanvas(ttk.Frame):
         if rgba is None:
             self._overlay_rgba = None
             self._overlay_tk_img = None
+            self._overlay_tk_spec = None
             if self._overlay_img_id is not None:
                 try:
                     self._canvas.delete(self._overlay_img_id)
@@ -422,23 +472,6 @@ class ViewportCanvas(ttk.Frame):
         if shp not in ("square", "circle"):
             shp = "square"
 
-        # Build voxelized mask in patch coords
-        mask = np.ones((ph, pw), dtype=bool)
-        if shp == "circle" and s > 1:
-            eff_r = min(half_lo, half_hi)
-            yy, xx = np.ogrid[0:ph, 0:pw]
-            cy = int(r - r0)
-            cx = int(c - c0)
-            mask = (yy - cy) ** 2 + (xx - cx) ** 2 <= int(eff_r) * int(eff_r)
-
-        # RGBA patch (shadow)
-        alpha = 96
-        patch = np.zeros((ph, pw, 4), dtype=np.uint8)
-        patch[mask, 0] = np.uint8(rr)
-        patch[mask, 1] = np.uint8(gg)
-        patch[mask, 2] = np.uint8(bb)
-        patch[mask, 3] = np.uint8(alpha)
-
         # Convert patch bounds to display space (y flipped vs image row)
         disp_r0 = img_h - 1 - r1
         disp_r1 = img_h - 1 - r0
@@ -451,12 +484,36 @@ class ViewportCanvas(ttk.Frame):
         dw = max(int(round(x1 - x0)), 1)
         dh = max(int(round(y1 - y0)), 1)
 
-        pil = Image.fromarray(np.flipud(patch), mode="RGBA")
-        resampling = getattr(Image, "Resampling", Image)
-        resample = getattr(resampling, "NEAREST")
-        pil = pil.resize((int(dw), int(dh)), resample)
-
-        self._brush_preview_tk_img = ImageTk.PhotoImage(pil)
+        # Interior hovers produce an identical patch; only move the existing image.
+        key = (ph, pw, int(r - r0), int(c - c0), shp, s, rr, gg, bb, dw, dh)
+        if key != self._brush_preview_key or self._brush_preview_tk_img is None:
+            # Build voxelized mask in patch coords
+            mask = np.ones((ph, pw), dtype=bool)
+            if shp == "circle" and s > 1:
+                eff_r = min(half_lo, half_hi)
+                yy, xx = np.ogrid[0:ph, 0:pw]
+                cy = int(r - r0)
+                cx = int(c - c0)
+                mask = (yy - cy) ** 2 + (xx - cx) ** 2 <= int(eff_r) * int(eff_r)
+
+            # RGBA patch (shadow)
+            alpha = 96
+            patch = np.zeros((ph, pw, 4), dtype=np.uint8)
+            patch[mask] = (rr, gg, bb, alpha)
+
+            pil = Image.fromarray(np.flipud(patch), mode="RGBA")
+            resampling = getattr(Image, "Resampling", Image)
+            resample = getattr(resampling, "NEAREST")
+            pil = pil.resize((int(dw), int(dh)), resample)
+
+            prev = self._brush_preview_tk_img
+            prev_key = self._brush_preview_key
+            if prev is not None and prev_key is not None and prev_key[-2:] == (dw, dh):
+                # Same display size (eg color change): repaint the existing Tk image in place.
+                prev.paste(pil)
+            else:
+                self._brush_preview_tk_img = ImageTk.PhotoImage(pil)
+            self._brush_preview_key = key
 
         # id might be stale if canvas was cleared
         if self._brush_preview_img_id is not None:
@@ -510,8 +567,11 @@ class ViewportCanvas(ttk.Frame):
         mm_per_px: Optional[float] = None,
         allow_overflow: bool = False,
         zoom_scale: Optional[float] = None,
+        value_range: Optional[Tuple[float, float]] = None,
+        cache_key: Optional[tuple] = None,
     ) -> None:
         self._last_base = np.asarray(base)
+        self._cache_key = cache_key
         self._last_title = str(title)
         self._last_res = (float(res[0]), float(res[1]))
         self._last_overlay = overlay
@@ -523,6 +583,7 @@ class ViewportCanvas(ttk.Frame):
         self._allow_upsample = bool(allow_upsample)
         self._lock_mm_per_px = None if mm_per_px is None else float(mm_per_px)
         self._allow_overflow = bool(allow_overflow)
+        self._value_range = None if value_range is None else (float(value_range[0]), float(value_range[1]))
         prev_zoom = self._zoom_scale
         if zoom_scale is None:
             self._zoom_scale = 1.0
@@ -546,13 +607,18 @@ class ViewportCanvas(ttk.Frame):
     def clear(self) -> None:
         self._last_base = None
         self._last_overlay = None
+        self._cache_key = None
+        self._rgb_cache.clear()
         self._canvas.delete("all")
         self._tk_img = None
+        self._tk_img_key = None
         self._img_id = None
         self._title_id = None
+        self._crosshair_ids = None
         self._render_state = None
         self._overlay_rgba = None
         self._overlay_tk_img = None
+        self._overlay_tk_spec = None
         self._overlay_img_id = None
         self._brush_preview_img_id = None
         self._brush_preview_tk_img = None
@@ -731,11 +797,9 @@ class ViewportCanvas(ttk.Frame):
             self._resize_job = self.after(16, self._render)
             return
 
-        self._canvas.delete("all")
-        # After delete("all"), all canvas items are gone - reset stored ids so layers recreate.
-        self._img_id = None
-        self._title_id = None
-        self._overlay_img_id = None
+        # Keep the base, label-overlay and title items alive across renders and update them
+        # in place; only the cheap vector items (crosshair, markers) are rebuilt.
+        self._clear_canvas_items(keep_base=self._last_base is not None)
         self._brush_preview_img_id = None
         self._brush_preview_tk_img = None
         self._markers = []
@@ -744,18 +808,13 @@ class ViewportCanvas(ttk.Frame):
         if self._last_base is None:
             return
 
-        base = np.asarray(self._last_base)
+        # Flip rows as a view so the uint8 conversion writes display order directly
+        # and PIL receives a contiguous buffer (no extra flipud copy).
+        base = np.asarray(self._last_base)[::-1]
         if np.iscomplexobj(base):
             base = np.abs(base)
 
-        # Render base -> RGB uint8
-        base_rgb = self._base_to_rgb(base)
-
-        # Apply overlay if present -> RGB uint8
-        if self._last_overlay is not None:
-            base_rgb = self._apply_overlay(base_rgb, self._last_overlay)
-
-        pil_img = Image.fromarray(np.flipud(base_rgb), mode="RGB")
+        img_h, img_w = int(base.shape[0]), int(base.shape[1])
 
         # cw/ch already computed at the start of _render()
         cw = max(int(cw), 1)
@@ -763,8 +822,8 @@ class ViewportCanvas(ttk.Frame):
 
         # aspect from physical resolution if meaningful
         res_row, res_col = self._last_res
-        width_mm = float(base.shape[1]) * res_col if base.ndim >= 2 else float(pil_img.width)
-        height_mm = float(base.shape[0]) * res_row if base.ndim >= 2 else float(pil_img.height)
+        width_mm = float(img_w) * res_col
+        height_mm = float(img_h) * res_row
         lock_mm_per_px = self._lock_mm_per_px
         if lock_mm_per_px is not None and width_mm > 0 and height_mm > 0:
             mm_per_px = max(float(lock_mm_per_px), 1e-6)
@@ -774,7 +833,7 @@ class ViewportCanvas(ttk.Frame):
             if width_mm > 0 and height_mm > 0:
                 aspect = width_mm / height_mm
             else:
-                aspect = pil_img.width / max(pil_img.height, 1)
+                aspect = img_w / max(img_h, 1)
 
             canvas_aspect = cw / max(ch, 1)
             if canvas_aspect >= aspect:
@@ -786,11 +845,43 @@ class ViewportCanvas(ttk.Frame):
 
         # Pixel-perfect mode: do not enlarge beyond native pixel size.
         if not self._allow_upsample:
-            tw = min(int(tw), int(pil_img.width))
-            th = min(int(th), int(pil_img.height))
+            tw = min(int(tw), img_w)
+            th = min(int(th), img_h)
             tw = max(int(tw), 1)
             th = max(int(th), 1)
 
+        # Planes much larger than their on-screen size are decimated before conversion, so the
+        # work scales with displayed pixels; the NEAREST resize below would drop them anyway.
+        # Each axis gets its own stride so thin-slab planes (eg Z-Y) still shrink along the long axis.
+        stride = (max(1, img_h // th), max(1, img_w // tw))
+        overlay = None if self._last_overlay is None else _flipud_overlay(self._last_overlay)
+        cache_key = self._cache_key
+        if stride != (1, 1):
+            base = base[:: stride[0], :: stride[1]]
+            if overlay is not None:
+                overlay = _decimate_overlay(overlay, stride)
+            if cache_key is not None:
+                cache_key = cache_key + ("stride",) + stride
+
+        # When only another plane's index moved, this plane's photo already shows the same
+        # slice at the same size; skip conversion, resize and paste and just reposition items.
+        tk_key = None if cache_key is None or overlay is not None else (cache_key, tw, th)
+        pil_img: Optional[Image.Image] = None
+        if tk_key is None or tk_key != self._tk_img_key or self._tk_img is None:
+            # Render base -> uint8 (grayscale stays single-channel so resizing touches 1/3 of the bytes)
+            base_disp = self._cached_base_image(base, cache_key)
+
+            # Apply overlay if present -> RGB uint8
+            if overlay is not None:
+                if base_disp.ndim == 2:
+                    base_disp = np.stack([base_disp, base_disp, base_disp], axis=2)
+                base_disp = self._apply_overlay(base_disp, overlay)
+
+            if base_disp.ndim == 2:
+                pil_img = Image.fromarray(base_disp)
+            else:
+                pil_img = Image.fromarray(base_disp, mode="RGB")
+
         base_ox = (cw - tw) // 2
         base_oy = (ch - th) // 2
 
@@ -821,30 +912,61 @@ class ViewportCanvas(ttk.Frame):
                     pan_y = float(ty) - float(base_oy) - (v * float(th))
         self._pan_offset = (pan_x, pan_y)
 
-        resampling = getattr(Image, "Resampling", Image)
-        resample = getattr(resampling, "NEAREST")
-        pil_img = pil_img.resize((tw, th), resample)
+        if pil_img is not None:
+            if (tw, th) != pil_img.size:
+                resampling = getattr(Image, "Resampling", Image)
+                resample = getattr(resampling, "NEAREST")
+                pil_img = pil_img.resize((tw, th), resample)
 
-        self._tk_img = ImageTk.PhotoImage(pil_img)
+            # Paste into the existing Tk photo when mode/size match instead of creating a new Tk image.
+            tk_spec = (pil_img.mode, pil_img.size)
+            if self._tk_img is not None and self._tk_img_spec == tk_spec:
+                self._tk_img.paste(pil_img)
+            else:
+                self._tk_img = ImageTk.PhotoImage(pil_img)
+                self._tk_img_spec = tk_spec
+            self._tk_img_key = tk_key
         ox = base_ox
         oy = base_oy
         ox = int(round(float(ox) + self._pan_offset[0]))
         oy = int(round(float(oy) + self._pan_offset[1]))
-        self._render_state = (int(base.shape[0]), int(base.shape[1]), int(ox), int(oy), int(tw), int(th))
+        self._render_state = (img_h, img_w, int(ox), int(oy), int(tw), int(th))
 
-        self._img_id = self._canvas.create_image(ox, oy, anchor="nw", image=self._tk_img)
+        if self._img_id is not None:
+            try:
+                self._canvas.itemconfigure(self._img_id, image=self._tk_img)
+                self._canvas.coords(self._img_id, ox, oy)
+            except Exception:
+                self._img_id = None
+        if self._img_id is None:
+            self._img_id = self._canvas.create_image(ox, oy, anchor="nw", image=self._tk_img)
 
         # Draw independent RGBA overlay layer (eg label painting) on top of base
         if self._overlay_rgba is not None:
             self._render_overlay_layer()
 
         if self._last_title:
-            self._title_id = self._canvas.create_text(
-                10, 10, anchor="nw", fill="#dddddd", text=self._last_title, font=("TkDefaultFont", 10, "bold")
-            )
+            if self._title_id is not None:
+                try:
+                    self._canvas.itemconfigure(self._title_id, text=self._last_title)
+                    self._canvas.tag_raise(self._title_id)
+                except Exception:
+                    self._title_id = None
+            if self._title_id is None:
+                self._title_id = self._canvas.create_text(
+                    10, 10, anchor="nw", fill="#dddddd", text=self._last_title, font=("TkDefaultFont", 10, "bold")
+                )
+        elif self._title_id is not None:
+            try:
+                self._canvas.delete(self._title_id)
+            except Exception:
+                pass
+            self._title_id = None
 
         if self._show_crosshair and self._crosshair_rc is not None:
             self._draw_crosshair(self._crosshair_rc[0], self._crosshair_rc[1])
+        else:
+            self._remove_crosshair()
 
         self._zoom_changed = False
 
@@ -854,6 +976,33 @@ class ViewportCanvas(ttk.Frame):
         for r0, c0, r1, c1, color, width in self._box_data:
             self.add_box(r0, c0, r1, c1, color=color, width=width)
 
+    def _clear_canvas_items(self, *, keep_base: bool) -> None:
+        keep = self._img_id if keep_base else None
+        if keep is not None:
+            try:
+                if not self._canvas.type(keep):
+                    keep = None
+            except Exception:
+                keep = None
+        if keep is None:
+            self._canvas.delete("all")
+            self._img_id = None
+            self._title_id = None
+            self._crosshair_ids = None
+            return
+        try:
+            self._canvas.addtag_all("_stale")
+            self._canvas.dtag(keep, "_stale")
+            for item in (self._title_id, self._overlay_img_id, *(self._crosshair_ids or ())):
+                if item is not None:
+                    self._canvas.dtag(item, "_stale")
+            self._canvas.delete("_stale")
+        except Exception:
+            self._canvas.delete("all")
+            self._img_id = None
+            self._title_id = None
+            self._crosshair_ids = None
+
     def _render_overlay_layer(self) -> None:
         if self._overlay_rgba is None:
             return
@@ -864,6 +1013,13 @@ class ViewportCanvas(ttk.Frame):
 
         arr = np.asarray(self._overlay_rgba)
         if arr.shape[0] != img_h or arr.shape[1] != img_w or arr.shape[2] != 4:
+            # Stale overlay from another plane; hide the kept item until it is replaced.
+            if self._overlay_img_id is not None:
+                try:
+                    self._canvas.delete(self._overlay_img_id)
+                except Exception:
+                    pass
+                self._overlay_img_id = None
             return
 
         pil = Image.fromarray(np.flipud(arr), mode="RGBA")
@@ -871,7 +1027,12 @@ class ViewportCanvas(ttk.Frame):
         resample = getattr(resampling, "NEAREST")
         pil = pil.resize((int(tw), int(th)), resample)
 
-        self._overlay_tk_img = ImageTk.PhotoImage(pil)
+        # Same-size updates (slice scrubbing, paint flushes) paste into the existing photo.
+        if self._overlay_tk_img is not None and self._overlay_tk_spec == pil.size:
+            self._overlay_tk_img.paste(pil)
+        else:
+            self._overlay_tk_img = ImageTk.PhotoImage(pil)
+            self._overlay_tk_spec = pil.size
 
         # If the canvas was cleared (delete("all")), the stored id may refer to a non-existent item.
         if self._overlay_img_id is not None:
@@ -901,6 +1062,25 @@ class ViewportCanvas(ttk.Frame):
             except Exception:
                 pass
 
+    def _cached_base_image(self, base: np.ndarray, key: Optional[tuple]) -> np.ndarray:
+        if key is None:
+            return self._base_to_image(base, reuse=True)
+        cached = self._rgb_cache.get(key)
+        if cached is not None and cached.shape[:2] == base.shape[:2]:
+            self._rgb_cache.move_to_end(key)
+            return cached
+        img = self._base_to_image(base, reuse=False)
+        self._rgb_cache[key] = img
+        while len(self._rgb_cache) > self._rgb_cache_limit:
+            self._rgb_cache.popitem(last=False)
+        return img
+
+    def _base_to_image(self, base: np.ndarray, *, reuse: bool) -> np.ndarray:
+        # (H, W) uint8 for grayscale, (H, W, 3) uint8 for RGB bases.
+        if base.ndim == 3 and base.shape[2] == 3:
+            return self._base_to_rgb(base)
+        return self._base_to_gray(base, reuse=reuse)
+
     def _base_to_rgb(self, base: np.ndarray) -> np.ndarray:
         if base.ndim == 3 and base.shape[2] == 3:
             arr = np.asarray(base)
@@ -912,19 +1092,31 @@ class ViewportCanvas(ttk.Frame):
                     arr = np.clip(arr, 0, 255).astype(np.uint8)
             return arr
 
-        img = np.asarray(base)
-        try:
-            img = img.astype(np.float32, copy=False)
-        except Exception:
-            img = img.astype(float, copy=False)
-
-        vmin, vmax = np.nanpercentile(img, (1.0, 99.0))
-        if np.isclose(vmin, vmax):
-            vmax = vmin + 1.0
-        norm = np.clip((img - vmin) / (vmax - vmin), 0.0, 1.0)
-        u8 = (norm * 255.0).astype(np.uint8)
+        u8 = self._base_to_gray(base, reuse=True)
         return np.stack([u8, u8, u8], axis=2)
 
+    def _base_to_gray(self, base: np.ndarray, *, reuse: bool) -> np.ndarray:
+        img = np.asarray(base)
+        if self._value_range is not None:
+            vmin, vmax = self._value_range
+            if np.isclose(vmin, vmax):
+                vmax = vmin + 1.0
+        else:
+            vmin, vmax = _auto_window(img)
+        scratch = self._pooled("_f32_pool", img.shape)
+        if not reuse:
+            return window_to_uint8(img, vmin, vmax, scratch=scratch)
+        return window_to_uint8(img, vmin, vmax, out=self._pooled("_u8_pool", img.shape), scratch=scratch)
+
+    def _pooled(self, attr: str, shape: Tuple[int, ...]) -> np.ndarray:
+        # View of a flat scratch pool, grown (never shrunk) to the largest request seen.
+        size = int(np.prod(shape, dtype=np.int64))
+        pool = getattr(self, attr)
+        if pool.size < size:
+            pool = np.empty(size, dtype=pool.dtype)
+            setattr(self, attr, pool)
+        return pool[:size].reshape(shape)
+
     def _apply_overlay(self, base_rgb: np.ndarray, ov: OverlaySpec) -> np.ndarray:
         h, w = base_rgb.shape[0], base_rgb.shape[1]
         data = np.asarray(ov.data)
@@ -934,11 +1126,12 @@ class ViewportCanvas(ttk.Frame):
             # If you want, you can add nearest resize here, but it costs CPU.
             return base_rgb
 
-        mask = np.ones((h, w), dtype=bool)
+        # None means "draw everywhere"; avoids building an all-True plane per render.
+        mask: Optional[np.ndarray] = None
         if ov.mask is not None:
             m = np.asarray(ov.mask).astype(bool, copy=False)
             if m.shape == (h, w):
-                mask &= m
+                mask = m
 
         # normalize to 0..1
         if ov.vmin is None and ov.vmax is None and np.issubdtype(data.dtype, np.floating):
@@ -946,26 +1139,30 @@ class ViewportCanvas(ttk.Frame):
             dmin = float(np.nanmin(data)) if np.size(data) else 0.0
             dmax = float(np.nanmax(data)) if np.size(data) else 1.0
             if dmin >= 0.0 and dmax <= 1.0:
-                norm = np.clip(data, 0.0, 1.0)
+                vmin, vmax = 0.0, 1.0
             else:
-                vmin, vmax = float(np.nanpercentile(data, 1.0)), float(np.nanpercentile(data, 99.0))
-                if np.isclose(vmin, vmax):
-                    vmax = vmin + 1.0
-                norm = np.clip((data - vmin) / (vmax - vmin), 0.0, 1.0)
+                vmin, vmax = _auto_window(data)
         else:
-            vmin = float(ov.vmin) if ov.vmin is not None else float(np.nanpercentile(data, 1.0))
-            vmax = float(ov.vmax) if ov.vmax is not None else float(np.nanpercentile(data, 99.0))
+            auto = _auto_window(data) if ov.vmin is None or ov.vmax is None else (0.0, 1.0)
+            vmin = float(ov.vmin) if ov.vmin is not None else auto[0]
+            vmax = float(ov.vmax) if ov.vmax is not None else auto[1]
             if np.isclose(vmin, vmax):
                 vmax = vmin + 1.0
-            norm = np.clip((data - vmin) / (vmax - vmin), 0.0, 1.0)
 
-        idx = (norm * 255.0).astype(np.uint8)
         lut = np.asarray(ov.lut, dtype=np.uint8)
         if lut.shape != (256, 3):
             return base_rgb
 
-        rgba = lut[idx]  # (H, W, 3)
-        out = base_rgb.copy()
+        # Index, colour and blend in pooled buffers; the result is consumed (PIL copy) before the
+        # next render reuses them. base_rgb may be a cached image and is never written.
+        idx = window_to_uint8(
+            data,
+            vmin,
+            vmax,
+            out=self._pooled("_ov_idx_pool", (h, w)),
+            scratch=self._pooled("_f32_pool", (h, w)),
+        )
+        rgba = np.take(lut, idx, axis=0, out=self._pooled("_ov_rgb_pool", (h, w, 3)))  # (H, W, 3)
 
         alpha = float(ov.alpha)
         if ov.alpha_map is not None:
@@ -974,13 +1171,21 @@ class ViewportCanvas(ttk.Frame):
                 a = np.clip(a, 0.0, 1.0).astype(np.float32, copy=False)
                 # broadcast to 3 channels
                 a3 = a[:, :, None]
+                if mask is None:
+                    return self._blend_into(rgba, base_rgb, a3)
+                out = base_rgb.copy()
                 m3 = mask[:, :, None]
                 out[m3] = (out[m3].astype(np.float32) * (1.0 - a3[m3]) + rgba[m3].astype(np.float32) * a3[m3]).astype(np.uint8)
                 return out
 
         # constant alpha
         if alpha <= 0.0:
-            return out
+            return base_rgb.copy()
+        if mask is None:
+            if alpha >= 1.0:
+                return rgba
+            return self._blend_into(rgba, base_rgb, alpha)
+        out = base_rgb.copy()
         if alpha >= 1.0:
             out[mask] = rgba[mask]
             return out
@@ -989,18 +1194,82 @@ class ViewportCanvas(ttk.Frame):
         out[m] = (out[m].astype(np.float32) * (1.0 - alpha) + rgba[m].astype(np.float32) * alpha).astype(np.uint8)
         return out
 
+    def _blend_into(self, rgba: np.ndarray, base_rgb: np.ndarray, alpha: Union[float, np.ndarray]) -> np.ndarray:
+        # rgba <- base + (rgba - base) * alpha, with one pooled float32 scratch.
+        acc = self._pooled("_ov_f32_pool", rgba.shape)
+        np.subtract(rgba, base_rgb, out=acc, dtype=np.float32)
+        np.multiply(acc, alpha, out=acc)
+        np.add(acc, base_rgb, out=acc)
+        np.copyto(rgba, acc, casting="unsafe")
+        return rgba
+
     def _draw_crosshair(self, row: int, col: int) -> None:
         state = self._render_state
         if state is None:
             return
         img_h, img_w, ox, oy, tw, th = state
         if row < 0 or col < 0 or row >= img_h or col >= img_w:
+            self._remove_crosshair()
             return
         disp_row = img_h - 1 - int(row)
         x = ox + (int(col) + 0.5) * tw / img_w
         y = oy + (disp_row + 0.5) * th / img_h
         x0, x1 = ox, ox + tw
         y0, y1 = oy, oy + th
+        # Move the existing lines instead of recreating them on every slice change.
+        if self._crosshair_ids is not None:
+            h_id, v_id = self._crosshair_ids
+            try:
+                self._canvas.coords(h_id, x0, y, x1, y)
+                self._canvas.coords(v_id, x, y0, x, y1)
+                self._canvas.tag_raise(h_id)
+                self._canvas.tag_raise(v_id)
+                return
+            except Exception:
+                self._crosshair_ids = None
         dash = (2, 4)
-        self._canvas.create_line(x0, y, x1, y, fill="#ffffff", width=1, dash=dash)
-        self._canvas.create_line(x, y0, x, y1, fill="#ffffff", width=1, dash=dash)
+        h_id = self._canvas.create_line(x0, y, x1, y, fill="#ffffff", width=1, dash=dash)
+        v_id = self._canvas.create_line(x, y0, x, y1, fill="#ffffff", width=1, dash=dash)
+        self._crosshair_ids = (h_id, v_id)
+
+    def _remove_crosshair(self) -> None:
+        if self._crosshair_ids is None:
+            return
+        try:
+            self._canvas.delete(*self._crosshair_ids)
+        except Exception:
+            pass
+        self._crosshair_ids = None
+
+
+def _auto_window(data: np.ndarray) -> Tuple[float, float]:
+    # 1/99 percentile fallback when the caller gave no window; histogram-based (linear, no sort).
+    data = np.asarray(data)
+    if data.ndim >= 2 and data.size > _AUTO_WINDOW_FULL_PIXELS:
+        data = data[::2, ::2]
+    window = histogram_window(data, 1.0, 99.0)
+    if window is None:
+        return (0.0, 1.0)
+    vmin, vmax = window
+    if np.isclose(vmin, vmax):
+        vmax = vmin + 1.0
+    return (float(vmin), float(vmax))
+
+
+def _decimate_overlay(ov: OverlaySpec, stride: Tuple[int, int]) -> OverlaySpec:
+    s = (slice(None, None, int(stride[0])), slice(None, None, int(stride[1])))
+    return replace(
+        ov,
+        data=np.asarray(ov.data)[s],
+        alpha_map=None if ov.alpha_map is None else np.asarray(ov.alpha_map)[s],
+        mask=None if ov.mask is None else np.asarray(ov.mask)[s],
+    )
+
+
+def _flipud_overlay(ov: OverlaySpec) -> OverlaySpec:
+    return replace(
+        ov,
+        data=np.asarray(ov.data)[::-1],
+        alpha_map=None if ov.alpha_map is None else np.asarray(ov.alpha_map)[::-1],
+        mask=None if ov.mask is None else np.asarray(ov.mask)[::-1],
+    )
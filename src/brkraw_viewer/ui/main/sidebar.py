@@ -24,6 +24,8 @@ class Sidebar(ttk.Frame):
         self._on_select_reco = on_select_reco  # reco selection callback
         self._scan_ids: list[int] = []  # listbox index -> scan id
         self._reco_ids: list[int] = []  # listbox index -> reco id
+        self._scan_labels: list[str] = []  # listbox rows as last inserted
+        self._reco_labels: list[str] = []
 
         self._scan_label_var = tk.StringVar(value="Scans (0)")  # scan count label
         self._reco_label_var = tk.StringVar(value="Recos (0)")  # reco count label
@@ -90,29 +92,66 @@ class Sidebar(ttk.Frame):
 
     def set_scan_list(self, scan_ids: list[tuple[int, str]] | list[int]) -> None:
         """Replace the scan list with IDs or (id, label) pairs and reset selection."""
-        self._scan_listbox.delete(0, "end")
-        self._scan_ids = []
+        new_ids: list[int] = []
+        labels: list[str] = []
         for item in scan_ids:
             if isinstance(item, tuple):
                 sid, label = item
             else:
                 sid, label = int(item), str(item)
-            self._scan_ids.append(int(sid))
-            self._scan_listbox.insert("end", label)
+            new_ids.append(int(sid))
+            labels.append(str(label))
+        if new_ids == self._scan_ids and labels == self._scan_labels:
+            # Same rows (eg refresh of the same dataset): keep the widget, only reset selection.
+            self._scan_listbox.selection_clear(0, "end")
+        else:
+            self._scan_listbox.delete(0, "end")
+            if labels:
+                self._scan_listbox.insert("end", *labels)
+            self._scan_ids = new_ids
+            self._scan_labels = labels
         self._scan_label_var.set(f"Scans ({len(self._scan_ids)})")
         self._scan_selected_var.set("Selected: -")
 
+    def update_scan_labels(self, entries: list[tuple[int, str]]) -> None:
+        """Relabel changed rows in place, keeping the selection and scroll position."""
+        if [int(sid) for sid, _ in entries] != self._scan_ids:
+            self.set_scan_list(entries)
+            return
+        listbox = self._scan_listbox
+        top = listbox.yview()[0]
+        selected = set(listbox.curselection())
+        for idx, (_, label) in enumerate(entries):
+            label = str(label)
+            if label == self._scan_labels[idx]:
+                continue
+            listbox.delete(idx)
+            listbox.insert(idx, label)
+            if idx in selected:
+                listbox.selection_set(idx)
+            self._scan_labels[idx] = label
+        listbox.yview_moveto(top)
+
     def set_reco_list(self, reco_ids: list[tuple[int, str]] | list[int]) -> None:
         """Replace the reco list with IDs or (id, label) pairs and reset selection."""
-        self._reco_listbox.delete(0, "end")
-        self._reco_ids = []
+        new_ids: list[int] = []
+        labels: list[str] = []
         for item in reco_ids:
             if isinstance(item, tuple):
                 rid, label = item
             else:
                 rid, label = int(item), str(item)
-            self._reco_ids.append(int(rid))
-            self._reco_listbox.insert("end", label)
+            new_ids.append(int(rid))
+            labels.append(str(label))
+        if new_ids == self._reco_ids and labels == self._reco_labels:
+            # Same rows (eg refresh of the same dataset): keep the widget, only reset selection.
+            self._reco_listbox.selection_clear(0, "end")
+        else:
+            self._reco_listbox.delete(0, "end")
+            if labels:
+                self._reco_listbox.insert("end", *labels)
+            self._reco_ids = new_ids
+            self._reco_labels = labels
         self._reco_label_var.set(f"Recos ({len(self._reco_ids)})")
         self._reco_selected_var.set("Selected: -")
 
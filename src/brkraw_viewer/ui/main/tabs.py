@@ -13,6 +13,8 @@ class TabsArea(ttk.Frame):
         self._tab_widgets: Dict[str, ttk.Frame] = {}
         self._detached: Dict[str, Tuple[tk.Toplevel, ttk.Frame, int]] = {}
         self._detached_geom: Dict[str, str] = {}
+        # Single-entry context menu, built once and relabeled per popup.
+        self._tab_menu: Optional[tk.Menu] = None
 
         self.columnconfigure(0, weight=1)
         self.rowconfigure(0, weight=1)
@@ -164,11 +166,15 @@ class TabsArea(ttk.Frame):
         if not title:
             return
 
-        menu = tk.Menu(self, tearoff=False)
+        menu = self._tab_menu
+        if menu is None:
+            menu = tk.Menu(self, tearoff=False)
+            menu.add_command(label="Detach")
+            self._tab_menu = menu
         if title in self._detached:
-            menu.add_command(label="Re-attach", command=lambda t=title: self.attach_tab(t))
+            menu.entryconfigure(0, label="Re-attach", command=lambda t=title: self.attach_tab(t))
         else:
-            menu.add_command(label="Detach", command=lambda t=title: self.detach_tab(t))
+            menu.entryconfigure(0, label="Detach", command=lambda t=title: self.detach_tab(t))
 
         try:
             menu.tk_popup(int(event.x_root), int(event.y_root))
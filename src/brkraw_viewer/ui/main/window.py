@@ -262,6 +262,9 @@ class MainWindow(ttk.Frame):
     def set_scan_list(self, scan_ids: Sequence[tuple[int, str]]) -> None:
         self.sidebar.set_scan_list(list(scan_ids))
 
+    def update_scan_labels(self, scan_ids: Sequence[tuple[int, str]]) -> None:
+        self.sidebar.update_scan_labels(list(scan_ids))
+
     def set_reco_list(self, reco_ids: Sequence[tuple[int, str]] | Sequence[int]) -> None:
         # Normalize to the exact list type expected by Sidebar.
         items = list(reco_ids)
@@ -318,6 +321,8 @@ class MainWindow(ttk.Frame):
         allow_overflow: bool = False,
         overflow_blend: float | None = None,
         zoom_scale: float | None = None,
+        value_range: tuple[float, float] | None = None,
+        cache_keys: dict | None = None,
     ) -> None:
         tab = self.tabs.get_tab("Viewer")
         target = getattr(tab, "_tab_instance", None)
@@ -332,6 +337,8 @@ class MainWindow(ttk.Frame):
                 allow_overflow=allow_overflow,
                 overflow_blend=overflow_blend,
                 zoom_scale=zoom_scale,
+                value_range=value_range,
+                cache_keys=cache_keys,
             )
 
     def set_viewer_subject_enabled(self, enabled: bool) -> None:
@@ -67,6 +67,8 @@ class AddonsTab:
         self._spec_tabs: Optional[ttk.Notebook] = None
 
         self._info_output_text: Optional[tk.Text] = None
+        self._info_output_shown: Optional[str] = None
+        self._output_menu: Optional[tk.Menu] = None
 
         for category in ("info_spec", "metadata_spec", "converter_hook"):
             self._addon_rule_sections[category] = {
@@ -468,6 +470,7 @@ class AddonsTab:
     def _reset_addon_state(self) -> None:
         if self._info_output_text is None:
             return
+        self._info_output_shown = ""
         self._info_output_text.configure(state=tk.NORMAL)
         self._info_output_text.delete("1.0", tk.END)
         self._info_output_text.configure(state=tk.DISABLED)
@@ -1117,8 +1120,11 @@ class AddonsTab:
             text.bind(sequence, handler)
 
     def _on_output_context_menu(self, event: tk.Event) -> None:
-        menu = tk.Menu(self._info_output_text, tearoff=0)
-        menu.add_command(label="Copy", command=self._copy_output_selection)
+        menu = self._output_menu
+        if menu is None:
+            menu = tk.Menu(self._info_output_text, tearoff=0)
+            menu.add_command(label="Copy", command=self._copy_output_selection)
+            self._output_menu = menu
         try:
             menu.tk_popup(event.x_root, event.y_root)
         finally:
@@ -1239,6 +1245,9 @@ class AddonsTab:
         if self._info_output_text is None:
             return
         text = self._format_payload(payload)
+        if text == self._info_output_shown:
+            return
+        self._info_output_shown = text
         self._info_output_text.configure(state=tk.NORMAL)
         self._info_output_text.delete("1.0", tk.END)
         self._info_output_text.insert(tk.END, text)
@@ -306,6 +306,8 @@ class ConvertTab:
         preview_scroll_x.grid(row=2, column=0, columnspan=2, sticky="ew")
         self._preview_text.configure(yscrollcommand=preview_scroll_y.set, xscrollcommand=preview_scroll_x.set)
         self._preview_text.configure(state=tk.DISABLED)
+        # Last text written to each box; identical updates skip the Text re-layout.
+        self._shown_text: dict[str, str] = {}
 
         self._update_sidecar_controls()
         self._update_convert_space_controls()
@@ -632,20 +634,23 @@ class ConvertTab:
         if self._layout_key_listbox is None:
             return
         self._layout_key_listbox.delete(0, tk.END)
-        for key in keys:
-            self._layout_key_listbox.insert(tk.END, key)
+        if keys:
+            self._layout_key_listbox.insert(tk.END, *keys)
 
     def set_preview_text(self, text: str) -> None:
-        self._preview_text.configure(state=tk.NORMAL)
-        self._preview_text.delete("1.0", tk.END)
-        self._preview_text.insert(tk.END, text)
-        self._preview_text.configure(state=tk.DISABLED)
+        self._set_readonly_text("preview", self._preview_text, text)
 
     def set_settings_text(self, text: str) -> None:
-        self._settings_text.configure(state=tk.NORMAL)
-        self._settings_text.delete("1.0", tk.END)
-        self._settings_text.insert(tk.END, text)
-        self._settings_text.configure(state=tk.DISABLED)
+        self._set_readonly_text("settings", self._settings_text, text)
+
+    def _set_readonly_text(self, key: str, widget: tk.Text, text: str) -> None:
+        if self._shown_text.get(key) == text:
+            return
+        self._shown_text[key] = text
+        widget.configure(state=tk.NORMAL)
+        widget.delete("1.0", tk.END)
+        widget.insert(tk.END, text)
+        widget.configure(state=tk.DISABLED)
 
     def set_orientation_fields(
         self,
@@ -2,7 +2,7 @@ from __future__ import annotations
 
 import tkinter as tk
 from tkinter import ttk
-from typing import Any, List
+from typing import Any, List, Optional
 
 
 class ParamsTab:
@@ -144,23 +144,22 @@ class ParamsTab:
             var.set(str(val) if val is not None else "")
 
     def set_search_results(self, rows: List[dict[str, Any]], *, truncated: int = 0) -> None:
-        self._params_tree.delete(*self._params_tree.get_children())
+        tree = self._params_tree
+        tree.delete(*tree.get_children())
+        values_list = []
         for row in rows:
             display_val = row.get("value", "")
             full_val = row.get("full_value", "")
             if not full_val and display_val:
                 full_val = display_val
-            self._params_tree.insert(
-                "",
-                "end",
-                values=(
-                    row.get("file", ""),
-                    row.get("key", ""),
-                    row.get("type", ""),
-                    display_val,
-                    full_val,
-                ),
-            )
+            values_list.append((row.get("file", ""), row.get("key", ""), row.get("type", ""), display_val, full_val))
+        # Sort before inserting so the tree does not have to be read back and reordered.
+        idx = self._params_sort_index()
+        if idx is not None:
+            values_list.sort(key=lambda values: _sort_val(values, idx), reverse=self._params_sort_desc)
+        insert = tree.insert
+        for values in values_list:
+            insert("", "end", values=values)
         if truncated:
             self._params_tree.insert(
                 "",
@@ -168,7 +167,6 @@ class ParamsTab:
                 values=("", "", "", f"... {truncated} more result(s)", ""),
                 tags=("truncated",),
             )
-        self._apply_params_sort()
         self._update_params_sort_heading()
         self._clear_detail()
 
@@ -181,40 +179,34 @@ class ParamsTab:
         self._apply_params_sort()
         self._update_params_sort_heading()
 
+    def _params_sort_index(self) -> Optional[int]:
+        if not self._params_sort_key:
+            return None
+        col_map = {"file": 0, "key": 1, "type": 2, "value": 3}
+        return col_map.get(self._params_sort_key)
+
     def _apply_params_sort(self) -> None:
-        if not self._params_tree or not self._params_sort_key:
+        if not self._params_tree:
             return
-
-        col_map = {"file": 0, "key": 1, "type": 2, "value": 3}
-        idx = col_map.get(self._params_sort_key)
+        idx = self._params_sort_index()
         if idx is None:
             return
 
-        items = list(self._params_tree.get_children())
         regular_items = []
         truncated_items = []
-
-        for item in items:
-            tags = self._params_tree.item(item, "tags")
-            if "truncated" in tags:
+        for item in self._params_tree.get_children():
+            # One Tcl round-trip per row for both tags and values.
+            info = self._params_tree.item(item)
+            if "truncated" in (info.get("tags") or ()):
                 truncated_items.append(item)
             else:
-                regular_items.append(item)
-
-        def _sort_val(item_id: str) -> tuple[int, Any]:
-            values = self._params_tree.item(item_id, "values")
-            raw = values[idx] if idx < len(values) else ""
-            try:
-                return (0, float(raw))
-            except Exception:
-                return (1, str(raw).lower())
+                regular_items.append((_sort_val(info.get("values") or (), idx), item))
 
-        regular_items.sort(key=_sort_val, reverse=self._params_sort_desc)
+        regular_items.sort(key=lambda pair: pair[0], reverse=self._params_sort_desc)
+        regular_items = [item for _, item in regular_items]
 
-        for item in regular_items:
-            self._params_tree.move(item, "", "end")
-        for item in truncated_items:
-            self._params_tree.move(item, "", "end")
+        # set_children reorders every row in one Tcl call instead of a move per row.
+        self._params_tree.set_children("", *regular_items, *truncated_items)
 
     def _update_params_sort_heading(self) -> None:
         if not self._params_tree:
@@ -263,3 +255,11 @@ class ParamsTab:
         self._detail_text.delete("1.0", tk.END)
         self._detail_text.insert(tk.END, str(value))
         self._detail_text.configure(state=tk.DISABLED)
+
+
+def _sort_val(values: Any, idx: int) -> tuple[int, Any]:
+    raw = values[idx] if idx < len(values) else ""
+    try:
+        return (0, float(raw))
+    except Exception:
+        return (1, str(raw).lower())
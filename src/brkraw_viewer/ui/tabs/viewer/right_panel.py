@@ -54,6 +54,8 @@ class ViewerRightPanel(ttk.Frame):
             )
             scale.pack(side=tk.LEFT)
             scale.configure(variable=var)
+            scale.bind("<ButtonPress-1>", lambda _e: self._on_scrub(True), add="+")
+            scale.bind("<ButtonRelease-1>", lambda _e: self._on_scrub(False), add="+")
             return scale
 
         self._x_var = tk.IntVar(value=0)
@@ -131,6 +133,9 @@ class ViewerRightPanel(ttk.Frame):
 
         self._last_indices: Optional[tuple[int, int, int]] = None
         self._suspend_callbacks = False
+        # Plain mirrors of the axis sliders so event handlers avoid Tcl variable round-trips.
+        self._axis_index: dict[str, int] = {"x": 0, "y": 0, "z": 0}
+        self._axis_max: dict[str, int] = {"x": 0, "y": 0, "z": 0}
 
     def _create_slider_row(self, parent: tk.Misc, label: str, var: tk.IntVar, command, length: int = 140) -> tuple[ttk.Frame, tk.Scale]:
         row = ttk.Frame(parent)
@@ -164,9 +169,18 @@ class ViewerRightPanel(ttk.Frame):
     def _on_axis(self, callbacks, axis: str, value: str) -> None:
         if self._suspend_callbacks:
             return
+        index = int(float(value))
+        if self._axis_index.get(axis) == index:
+            return
+        self._axis_index[axis] = index
         handler = getattr(callbacks, "on_viewer_axis_change", None)
         if callable(handler):
-            handler(axis, int(float(value)))
+            handler(axis, index)
+
+    def _on_scrub(self, active: bool) -> None:
+        handler = getattr(self._callbacks, "on_viewer_scrub", None)
+        if callable(handler):
+            handler(bool(active))
 
     def _on_frame(self, callbacks, value: str) -> None:
         if self._suspend_callbacks:
@@ -214,9 +228,9 @@ class ViewerRightPanel(ttk.Frame):
         handler = getattr(self._callbacks, "on_viewer_jump", None)
         if not callable(handler):
             return
-        xi = self._x_var.get()
-        yi = self._y_var.get()
-        zi = self._z_var.get()
+        xi = self._axis_index["x"]
+        yi = self._axis_index["y"]
+        zi = self._axis_index["z"]
         if plane == "xz":
             zi, xi = int(row), int(col)
         elif plane == "xy":
@@ -239,15 +253,13 @@ class ViewerRightPanel(ttk.Frame):
             axis, var, scale = "x", self._x_var, self._x_scale
         if axis is None or var is None or scale is None:
             return
-        try:
-            max_val = int(scale.cget("to"))
-        except Exception:
-            max_val = 0
-        cur = int(var.get())
+        max_val = self._axis_max.get(axis, 0)
+        cur = self._axis_index.get(axis, 0)
         step = 1 if int(direction) > 0 else -1
         nxt = max(0, min(max_val, cur + step))
         if nxt == cur:
             return
+        self._axis_index[axis] = nxt
         var.set(nxt)
         handler = getattr(self._callbacks, "on_viewer_axis_change", None)
         if callable(handler):
@@ -263,6 +275,7 @@ class ViewerRightPanel(ttk.Frame):
         self._x_scale.configure(to=max(x - 1, 0))
         self._y_scale.configure(to=max(y - 1, 0))
         self._z_scale.configure(to=max(z - 1, 0))
+        self._axis_max = {"x": max(x - 1, 0), "y": max(y - 1, 0), "z": max(z - 1, 0)}
         self._frame_scale.configure(to=max(frames - 1, 0))
         self._slicepack_scale.configure(to=max(slicepacks - 1, 0))
         self._frames_count = max(int(frames), 1)
@@ -323,6 +336,7 @@ class ViewerRightPanel(ttk.Frame):
             self._x_var.set(int(x))
             self._y_var.set(int(y))
             self._z_var.set(int(z))
+            self._axis_index = {"x": int(x), "y": int(y), "z": int(z)}
             self._frame_var.set(int(frame))
             self._slicepack_var.set(int(slicepack))
         finally:
@@ -340,6 +354,8 @@ class ViewerRightPanel(ttk.Frame):
         allow_overflow: bool = False,
         overflow_blend: float | None = None,
         zoom_scale: float | None = None,
+        value_range: Optional[tuple[float, float]] = None,
+        cache_keys: Optional[dict] = None,
     ) -> None:
         self._last_indices = indices
         if not views:
@@ -349,6 +365,7 @@ class ViewerRightPanel(ttk.Frame):
             return
         crosshair = crosshair or {}
         res = res or {}
+        cache_keys = cache_keys or {}
         # Shared scale ensures planes stay consistent; blend fit/fill and apply zoom.
         lock_mm_per_px = (
             self._compute_shared_mm_per_px(
@@ -373,6 +390,8 @@ class ViewerRightPanel(ttk.Frame):
                 mm_per_px=lock_mm_per_px,
                 allow_overflow=allow_overflow,
                 zoom_scale=zoom_scale,
+                value_range=value_range,
+                cache_key=cache_keys.get("xz"),
             )
         if "xy" in views:
             self._xy.set_view(
@@ -386,6 +405,8 @@ class ViewerRightPanel(ttk.Frame):
                 mm_per_px=lock_mm_per_px,
                 allow_overflow=allow_overflow,
                 zoom_scale=zoom_scale,
+                value_range=value_range,
+                cache_key=cache_keys.get("xy"),
             )
         if "zy" in views:
             self._zy.set_view(
@@ -399,6 +420,8 @@ class ViewerRightPanel(ttk.Frame):
                 mm_per_px=lock_mm_per_px,
                 allow_overflow=allow_overflow,
                 zoom_scale=zoom_scale,
+                value_range=value_range,
+                cache_key=cache_keys.get("zy"),
             )
         self._last_zoom_source = None
 
@@ -47,6 +47,8 @@ class ViewerTab:
         allow_overflow: bool = False,
         overflow_blend: float | None = None,
         zoom_scale: float | None = None,
+        value_range: tuple[float, float] | None = None,
+        cache_keys: dict | None = None,
     ) -> None:
         self.right.set_views(
             views,
@@ -58,6 +60,8 @@ class ViewerTab:
             allow_overflow=allow_overflow,
             overflow_blend=overflow_blend,
             zoom_scale=zoom_scale,
+            value_range=value_range,
+            cache_keys=cache_keys,
         )
 
     def set_subject_enabled(self, enabled: bool) -> None:
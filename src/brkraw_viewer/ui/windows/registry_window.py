@@ -131,12 +131,18 @@ class RegistryWindow:
     def refresh(self) -> None:
         entries = self._list_entries()
         self._tree.delete(*self._tree.get_children())
+        rows = []
         for entry in entries:
             values = [self._resolve_entry_value(entry, col["key"]) for col in self._columns]
             tag = "missing" if not entry.get("path") else ""
+            rows.append((values, tag))
+        # Insert already in sort order instead of re-reading and moving every row afterwards.
+        idx = self._sort_index()
+        if idx is not None:
+            rows.sort(key=lambda row: _sort_value(row[0], idx), reverse=self._sort_desc)
+        for values, tag in rows:
             self._tree.insert("", "end", values=values, tags=(tag,))
-        
-        self._apply_sort()
+
         self._update_sort_heading()
         
         self._status_var.set(f"{len(entries)} item(s)")
@@ -148,14 +154,14 @@ class RegistryWindow:
 
     def _load_columns(self) -> List[dict]:
         cols = registry_columns()
-        normalized = []
+        visible = []
         for col in cols:
-            if isinstance(col, dict) and "key" in col:
+            if isinstance(col, dict) and "key" in col and not col.get("hidden"):
                 entry = dict(col)
-                entry.setdefault("hidden", False)
+                entry["hidden"] = False
                 entry["display_title"] = str(entry.get("title") or entry["key"])
-                normalized.append(entry)
-        return [c for c in normalized if not c.get("hidden")]
+                visible.append(entry)
+        return visible
 
     def _configure_columns(self) -> None:
         for col in self._columns:
@@ -326,9 +332,9 @@ class RegistryWindow:
         min_w = 100
         max_w = max(title_w, min_w)
         
+        idx = [c["key"] for c in self._columns].index(key)
         for item in self._tree.get_children():
             values = self._tree.item(item, "values")
-            idx = [c["key"] for c in self._columns].index(key)
             if idx < len(values):
                 max_w = max(max_w, font.measure(str(values[idx])) + 24)
         self._tree.column(key, width=max_w, stretch=(key in ("basename", "path")))
@@ -341,6 +347,8 @@ class RegistryWindow:
         keys = [c["key"] for c in self._columns]
         widths: dict[str, int] = {}
         total = 0
+        # Read each row once rather than once per column.
+        rows = [self._tree.item(item, "values") for item in self._tree.get_children()]
         
         for key in keys:
             display_title = next((c["display_title"] for c in self._columns if c["key"] == key), key)
@@ -351,8 +359,7 @@ class RegistryWindow:
             
             idx = keys.index(key)
             max_content_w = 0
-            for item in self._tree.get_children():
-                values = self._tree.item(item, "values")
+            for values in rows:
                 if idx < len(values):
                     # Measure content width
                     max_content_w = max(max_content_w, font.measure(str(values[idx])) + 24)
@@ -400,28 +407,22 @@ class RegistryWindow:
         self._apply_sort()
         self._update_sort_heading()
 
-    def _apply_sort(self) -> None:
+    def _sort_index(self) -> Optional[int]:
         if not self._sort_key:
-            return
-        key = self._sort_key
+            return None
         keys = [c["key"] for c in self._columns]
         try:
-            idx = keys.index(key)
+            return keys.index(self._sort_key)
         except ValueError:
+            return None
+
+    def _apply_sort(self) -> None:
+        idx = self._sort_index()
+        if idx is None:
             return
         items = list(self._tree.get_children())
-
-        def _sort_value(item_id: str) -> tuple[int, Any]:
-            values = self._tree.item(item_id, "values")
-            raw = values[idx] if idx < len(values) else ""
-            try:
-                return (0, float(raw))
-            except Exception:
-                return (1, str(raw).lower())
-
-        items.sort(key=_sort_value, reverse=self._sort_desc)
-        for item in items:
-            self._tree.move(item, "", "end")
+        items.sort(key=lambda item_id: _sort_value(self._tree.item(item_id, "values"), idx), reverse=self._sort_desc)
+        self._tree.set_children("", *items)
 
     def _update_sort_heading(self) -> None:
         arrow = "▼" if self._sort_desc else "▲"
@@ -430,3 +431,11 @@ class RegistryWindow:
             title = col.get("display_title") or col.get("title") or key
             label = f"{title} {arrow}" if key == self._sort_key else title
             self._tree.heading(key, text=label)
+
+
+def _sort_value(values: Any, idx: int) -> tuple[int, Any]:
+    raw = values[idx] if idx < len(values) else ""
+    try:
+        return (0, float(raw))
+    except Exception:
+        return (1, str(raw).lower())
@@ -3,7 +3,7 @@ from __future__ import annotations
 import datetime as dt
 import tkinter as tk
 from tkinter import ttk
-from typing import Any, Iterable, Optional
+from typing import Any, Optional
 
 
 SUBJECT_FIELDS: list[tuple[str, list[tuple[str, str]]]] = [
@@ -47,11 +47,15 @@ class StudyInfoWindow:
         self.update_info(self._info)
         self._fit_to_content()
         _center_window(self._window, parent)
+        # Closing only hides the window; reopening reuses the built widgets.
+        self._window.protocol("WM_DELETE_WINDOW", self._window.withdraw)
 
     def winfo_exists(self) -> bool:
         return bool(self._window.winfo_exists())
 
     def lift(self) -> None:
+        if self._window.state() == "withdrawn":
+            self._window.deiconify()
         self._window.lift()
         self._window.focus_set()
 
@@ -63,8 +67,10 @@ class StudyInfoWindow:
         self._info = info or {}
         for label, paths in SUBJECT_FIELDS:
             value = None
-            for path in paths:
-                value = _lookup_nested(self._info, path)
+            for section, key in paths:
+                # Every field is two levels deep; direct gets avoid walking the whole info tree.
+                node = self._info.get(section)
+                value = node.get(key) if isinstance(node, dict) else None
                 if value not in (None, ""):
                     break
             if label == "Study Date":
@@ -92,15 +98,6 @@ class StudyInfoWindow:
             pass
 
 
-def _lookup_nested(info: dict, path: Iterable[str]) -> Any:
-    cur: Any = info
-    for key in path:
-        if not isinstance(cur, dict) or key not in cur:
-            return None
-        cur = cur.get(key)
-    return cur
-
-
 def _format_value(value: Any) -> str:
     if value is None:
         return ""
@@ -1,3 +1,4 @@
 from .orientation import reorient_to_ras
+from .display import estimate_display_window, histogram_window, window_to_uint8
 
-__all__ = ["reorient_to_ras"]
+__all__ = ["reorient_to_ras", "estimate_display_window", "histogram_window", "window_to_uint8"]
@@ -0,0 +1,89 @@
+from __future__ import annotations
+
+from typing import Optional, Tuple
+import numpy as np
+
+
+def window_to_uint8(
+    src: np.ndarray,
+    vmin: float,
+    vmax: float,
+    *,
+    out: Optional[np.ndarray] = None,
+    scratch: Optional[np.ndarray] = None,
+) -> np.ndarray:
+    """Clip ``src`` to [vmin, vmax] and scale to uint8 in a single float32 pass.
+
+    ``out`` (uint8) and ``scratch`` (float32) may be passed in to reuse buffers
+    of the same shape across calls. NaN maps to 0, -inf to 0 and +inf to 255.
+    """
+    src = np.asarray(src)
+    if scratch is None or scratch.shape != src.shape or scratch.dtype != np.float32:
+        scratch = np.empty(src.shape, dtype=np.float32)
+    if out is None or out.shape != src.shape or out.dtype != np.uint8:
+        out = np.empty(src.shape, dtype=np.uint8)
+    span = float(vmax) - float(vmin)
+    scale = 255.0 / span if span > 0 else 255.0
+    np.subtract(src, float(vmin), out=scratch, dtype=np.float32, casting="unsafe")
+    np.multiply(scratch, scale, out=scratch)
+    if src.dtype.kind in "fc":
+        # fmax drops NaN, so non-finite pixels draw as 0 instead of an undefined cast.
+        np.fmax(scratch, 0.0, out=scratch)
+        np.minimum(scratch, 255.0, out=scratch)
+    else:
+        np.clip(scratch, 0.0, 255.0, out=scratch)
+    np.copyto(out, scratch, casting="unsafe")
+    return out
+
+
+def histogram_window(
+    data: np.ndarray,
+    lo: float = 1.0,
+    hi: float = 99.0,
+    *,
+    nbins: int = 1024,
+) -> Optional[Tuple[float, float]]:
+    """Approximate (lo, hi) percentiles from a fixed-bin histogram.
+
+    Two linear passes (min/max, histogram) instead of a sort; accurate to one
+    bin width, which is plenty for display leveling. Non-finite values are ignored.
+    """
+    arr = np.asarray(data).ravel()
+    if not np.issubdtype(arr.dtype, np.integer):
+        finite = np.isfinite(arr)
+        # Boolean indexing copies; skip it for the common all-finite case.
+        if not finite.all():
+            arr = arr[finite]
+    if arr.size == 0:
+        return None
+    amin = float(arr.min())
+    amax = float(arr.max())
+    if amax <= amin:
+        return (amin, amax)
+    counts, edges = np.histogram(arr, bins=int(nbins), range=(amin, amax))
+    cdf = np.cumsum(counts)
+    total = float(cdf[-1])
+    i_lo = int(np.searchsorted(cdf, total * float(lo) / 100.0, side="left"))
+    i_hi = int(np.searchsorted(cdf, total * float(hi) / 100.0, side="left"))
+    return (float(edges[min(i_lo, nbins)]), float(edges[min(i_hi + 1, nbins)]))
+
+
+def estimate_display_window(vol: np.ndarray) -> Optional[Tuple[float, float]]:
+    """1/99 percentile display window of a volume, from a stride-2 subsample."""
+    shape = tuple(getattr(vol, "shape", ()))
+    if len(shape) < 3 or 0 in shape:
+        return None
+    # Strided indexing also works on lazy array proxies, which then read only the sample.
+    sample = np.asarray(vol[::2, ::2, ::2])
+    if np.iscomplexobj(sample):
+        sample = np.abs(sample)
+    try:
+        window = histogram_window(sample, 1.0, 99.0)
+    except Exception:
+        return None
+    if window is None:
+        return None
+    vmin, vmax = window
+    if np.isclose(vmin, vmax):
+        vmax = vmin + 1.0
+    return (float(vmin), float(vmax))
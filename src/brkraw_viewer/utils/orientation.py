@@ -5,13 +5,19 @@ import numpy as np
 import nibabel as nib
 
 
+_RAS_ORNT = np.array([[0, 1], [1, 1], [2, 1]])
+
+
 def reorient_to_ras(data: np.ndarray, affine: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """Reorient ``data`` to RAS. The result is a flipped/transposed view of ``data``, never a copy."""
     data = np.asarray(data)
     affine = np.asarray(affine, dtype=float)
 
     ornt = nib.orientations.io_orientation(affine)
-    ras_ornt = np.array([[0, 1], [1, 1], [2, 1]])  # RAS
-    transform = nib.orientations.ornt_transform(ornt, ras_ornt)
+    transform = nib.orientations.ornt_transform(ornt, _RAS_ORNT)
+    if np.array_equal(transform, _RAS_ORNT):
+        # Already RAS-aligned: nothing to permute or flip.
+        return data, affine.copy()
     new_data = nib.orientations.apply_orientation(data, transform)
     new_affine = affine @ nib.orientations.inv_ornt_aff(transform, data.shape)
     return new_data, new_affine
@@ -0,0 +1,76 @@
+import warnings
+
+import numpy as np
+import pytest
+
+from brkraw_viewer.utils.display import estimate_display_window, histogram_window, window_to_uint8
+
+
+def test_window_to_uint8_scales_and_clips():
+    src = np.array([[-10.0, 0.0], [50.0, 200.0]])
+    out = window_to_uint8(src, 0.0, 100.0)
+    assert out.dtype == np.uint8 and out.flags.c_contiguous
+    np.testing.assert_array_equal(out, [[0, 0], [127, 255]])
+
+
+def test_window_to_uint8_reuses_buffers():
+    src = np.arange(12, dtype=np.int16).reshape(3, 4)
+    out = np.empty(src.shape, dtype=np.uint8)
+    scratch = np.empty(src.shape, dtype=np.float32)
+    assert window_to_uint8(src, 0, 11, out=out, scratch=scratch) is out
+    assert out[0, 0] == 0 and out[-1, -1] == 255
+
+
+def test_window_to_uint8_lo_equals_hi():
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        out = window_to_uint8(np.array([1.0, 2.0, 3.0]), 2.0, 2.0)
+    np.testing.assert_array_equal(out, [0, 0, 255])
+
+
+def test_window_to_uint8_non_finite():
+    src = np.array([np.nan, np.inf, -np.inf, 5.0], dtype=np.float32)
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        out = window_to_uint8(src, 0.0, 10.0)
+    np.testing.assert_array_equal(out, [0, 255, 0, 127])
+
+
+def test_histogram_window_constant_and_all_nan():
+    assert histogram_window(np.full(100, 7.0)) == (7.0, 7.0)
+    assert histogram_window(np.full(100, np.nan)) is None
+    assert histogram_window(np.array([], dtype=np.float32)) is None
+
+
+@pytest.mark.parametrize("dtype", [np.float32, np.int16])
+def test_histogram_window_matches_percentile_within_one_bin(dtype):
+    rng = np.random.default_rng(0)
+    data = (rng.gamma(2.0, 300.0, size=200_000)).astype(dtype)
+    nbins = 1024
+    lo, hi = histogram_window(data, 1.0, 99.0, nbins=nbins)
+    ref_lo, ref_hi = np.percentile(data, [1.0, 99.0])
+    bin_w = (float(data.max()) - float(data.min())) / nbins
+    assert abs(lo - ref_lo) <= bin_w
+    assert abs(hi - ref_hi) <= bin_w
+
+
+def test_histogram_window_ignores_nan():
+    data = np.concatenate([np.linspace(0.0, 100.0, 10_001), np.full(50, np.nan)])
+    lo, hi = histogram_window(data, 1.0, 99.0)
+    assert lo == pytest.approx(1.0, abs=0.2)
+    assert hi == pytest.approx(99.0, abs=0.2)
+
+
+def test_estimate_display_window_edge_cases():
+    assert estimate_display_window(np.zeros((4, 4))) is None
+    assert estimate_display_window(np.zeros((4, 0, 4))) is None
+    assert estimate_display_window(np.full((6, 6, 6), np.nan)) is None
+    # A constant volume still gets a non-empty window.
+    assert estimate_display_window(np.full((6, 6, 6), 3.0)) == (3.0, 4.0)
+
+
+def test_estimate_display_window_complex_uses_magnitude():
+    vol = np.full((4, 4, 4), 3 + 4j)
+    vol[0, 0, 0] = 0
+    lo, hi = estimate_display_window(vol)
+    assert 0.0 <= lo <= hi <= 5.0
@@ -0,0 +1,137 @@
+import numpy as np
+import pytest
+
+from brkraw_viewer.ui.components import label_painter
+from brkraw_viewer.ui.components.label_painter import LabelMapPainter, _relabel_inplace
+
+
+class _StubViewport:
+    """Minimal viewport: queues idle callbacks and records the last overlay."""
+
+    def __init__(self) -> None:
+        self.idle: list = []
+        self.overlay = None
+
+    def after_idle(self, func):
+        self.idle.append(func)
+        return f"idle#{len(self.idle)}"
+
+    def after(self, _ms, func):
+        return self.after_idle(func)
+
+    def set_overlay_rgba(self, rgba) -> None:
+        self.overlay = None if rgba is None else np.array(rgba, copy=True)
+
+    def run_idle(self) -> None:
+        while self.idle:
+            self.idle.pop(0)()
+
+
+def _volume(shape, seed=0):
+    rng = np.random.default_rng(seed)
+    return rng.integers(0, 6, size=shape, dtype=np.uint16)
+
+
+def _large_shape():
+    # Enough slices that _relabel_inplace takes the slab path, with a partial last slab.
+    h, w = 256, 256
+    return (label_painter._RELABEL_SLAB_ELEMS // (h * w) + 3, h, w)
+
+
+@pytest.mark.parametrize("clear", [None, 0])
+def test_relabel_inplace_matches_reference(clear):
+    vol = _volume(_large_shape())
+    assert vol.size > label_painter._RELABEL_SLAB_ELEMS
+    expected = vol.copy()
+    if clear is not None:
+        expected[expected == 4] = clear
+    expected[vol == 2] = 4
+
+    _relabel_inplace(vol, 2, 4, clear)
+
+    np.testing.assert_array_equal(vol, expected)
+
+
+def test_relabel_inplace_small_array_single_pass():
+    arr = np.array([[1, 2], [2, 3]], dtype=np.int32)
+    _relabel_inplace(arr, 2, 3, 0)
+    np.testing.assert_array_equal(arr, [[1, 3], [3, 0]])
+
+
+def test_labels_to_rgba_alpha_cap_and_transparent_background():
+    painter = LabelMapPainter(_StubViewport())
+    painter.alpha = 100
+    painter.set_label_color(1, (10, 20, 30), alpha=255)
+    painter.set_label_color(2, (40, 50, 60), alpha=50)
+    labels = np.array([[0, 1], [2, 999]], dtype=np.int32)
+
+    rgba = painter.labels_to_rgba(labels)
+
+    assert rgba.dtype == np.uint8 and rgba.shape == (2, 2, 4)
+    assert rgba[0, 0, 3] == 0
+    np.testing.assert_array_equal(rgba[0, 1], [10, 20, 30, 100])
+    np.testing.assert_array_equal(rgba[1, 0], [40, 50, 60, 50])
+    # Out-of-range labels clip to the last LUT entry.
+    lut = painter.lut_rgba
+    assert tuple(rgba[1, 1, :3]) == tuple(lut[-1, :3])
+
+
+def test_display_lut_tracks_alpha_and_lut_changes():
+    painter = LabelMapPainter(_StubViewport())
+    painter.alpha = 200
+    first = painter._display_lut()
+    assert painter._display_lut() is first
+    assert first[0, 3] == 0 and first[1:, 3].max() <= 200
+
+    painter.alpha = 50
+    assert painter._display_lut()[1:, 3].max() <= 50
+
+    painter.set_label_color(3, (1, 2, 3))
+    np.testing.assert_array_equal(painter._display_lut()[3], [1, 2, 3, 50])
+
+
+def test_lut_rgba_is_read_only_and_setter_copies():
+    painter = LabelMapPainter(_StubViewport())
+    with pytest.raises(ValueError):
+        painter.lut_rgba[1] = 0
+    src = LabelMapPainter.default_lut_rgba(4)
+    painter.lut_rgba = src
+    src[1] = 7
+    assert not np.array_equal(painter.lut_rgba[1], src[1])
+
+
+def test_relabel_refreshes_only_affected_labels():
+    vp = _StubViewport()
+    painter = LabelMapPainter(vp)
+    painter.set_label_map(_volume((32, 32), seed=1))
+    painter.refresh_overlay_full()
+    vp.run_idle()
+
+    painter.relabel(2, 5, replace=True)
+    painter.delete_label(3)
+    vp.run_idle()
+
+    np.testing.assert_array_equal(vp.overlay, painter.labels_to_rgba(painter.label_map))
+    assert not np.any(np.isin(painter.label_map, (2, 3)))
+
+
+def test_refresh_region_and_bulk_colors_match_full_composite():
+    vp = _StubViewport()
+    painter = LabelMapPainter(vp)
+    painter.set_label_map(_volume((24, 40), seed=2))
+    painter.refresh_overlay_full()
+    vp.run_idle()
+
+    painter.label_map[4:8, 10:20] = 1
+    painter.refresh_overlay_region((4, 10, 7, 19))
+    np.testing.assert_array_equal(vp.overlay, painter.labels_to_rgba(painter.label_map))
+
+    painter.set_label_colors([1, 4], np.array([[255, 0, 0, 255], [0, 255, 0, 128]]))
+    vp.run_idle()
+    np.testing.assert_array_equal(vp.overlay, painter.labels_to_rgba(painter.label_map))
+
+    # Growing the LUT forces a full recomposite.
+    painter.set_label_colors([300], np.array([[1, 1, 1, 255]]))
+    vp.run_idle()
+    assert painter.lut_rgba.shape[0] == 301
+    np.testing.assert_array_equal(vp.overlay, painter.labels_to_rgba(painter.label_map))
@@ -0,0 +1,44 @@
+from multiprocessing import shared_memory
+
+import numpy as np
+import pytest
+
+from brkraw_viewer.app.workers.shm import adopt_shared_array, create_shared_array
+
+
+def _assert_unlinked(name: str) -> None:
+    with pytest.raises(FileNotFoundError):
+        shared_memory.SharedMemory(name=name)
+
+
+@pytest.mark.parametrize(
+    "src",
+    [
+        np.arange(24, dtype=np.int16).reshape(2, 3, 4),
+        np.linspace(0.0, 1.0, 60, dtype=np.float64).reshape(3, 4, 5),
+        np.arange(6, dtype=np.uint8),
+    ],
+)
+def test_shared_array_round_trip(src):
+    name = create_shared_array(src)
+    arr = adopt_shared_array(name, src.shape, str(src.dtype))
+    _assert_unlinked(name)
+    assert arr.dtype == src.dtype and arr.shape == src.shape
+    np.testing.assert_array_equal(arr, src)
+
+
+def test_shared_array_cast_on_copy():
+    src = np.linspace(-2.0, 2.0, 120).reshape(2, 3, 4, 5)
+    name = create_shared_array(src, dtype=np.float32)
+    arr = adopt_shared_array(name, src.shape, "float32")
+    _assert_unlinked(name)
+    assert arr.dtype == np.float32
+    np.testing.assert_allclose(arr, src.astype(np.float32))
+
+
+def test_adopted_array_outlives_views():
+    src = np.arange(27, dtype=np.int32).reshape(3, 3, 3)
+    arr = adopt_shared_array(create_shared_array(src), src.shape, "int32")
+    view = arr[1]
+    del arr
+    np.testing.assert_array_equal(view, src[1])